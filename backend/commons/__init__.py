@@ -21,6 +21,7 @@ from commons.security import (
 )
 
 from commons.logger import logger
+from commons.object_id import parse_object_id
 
 __all__ = [
     # Password
@@ -41,4 +42,6 @@ __all__ = [
     "verify_email_verification_token",
     # Logger
     "logger",
+    # ObjectId
+    "parse_object_id",
 ]
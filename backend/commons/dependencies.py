@@ -6,6 +6,7 @@ Handles authentication, authorization, and common dependencies.
 """
 
 from typing import Optional
+from bson import ObjectId
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -61,8 +62,6 @@ async def get_current_user(
 
     # Get user from database
     engine = get_engine()
-    from bson import ObjectId
-
     try:
         user = await engine.find_one(User, User.id == ObjectId(user_id))
     except Exception:
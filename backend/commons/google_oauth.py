@@ -8,6 +8,7 @@ Provides utilities to:
 - Fetch user information from Google
 """
 
+import importlib.util
 import os
 import httpx
 from typing import Dict, Any, Optional
@@ -37,6 +38,9 @@ GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
 
+# Static headers for the token exchange (built once, reused per call)
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 # Scopes to request
 GOOGLE_SCOPES = [
     "openid",
@@ -45,6 +49,45 @@ GOOGLE_SCOPES = [
 ]
 
 
+# =============================================================================
+# HTTP Client
+# =============================================================================
+
+# One client shared by all Google calls so the token exchange and userinfo
+# requests reuse pooled connections (multiplexed over HTTP/2) instead of a
+# fresh TCP + TLS handshake per request
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Single origin per endpoint: a small pool with long-lived keep-alive
+# connections favours reuse over opening new sockets under bursts of logins
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0
+)
+
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it httpx
+# raises ImportError on client creation, so fall back to HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+if not _HTTP2_AVAILABLE:
+    log.warning("h2 not installed, Google OAuth client will use HTTP/1.1")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient for Google API calls (created on first use)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared AsyncClient (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 # =============================================================================
 # OAuth URL Generation
 # =============================================================================
@@ -114,25 +157,27 @@ async def exchange_code_for_tokens(code: str) -> Optional[Dict[str, Any]]:
         "grant_type": "authorization_code",
     }
 
+    # Outside the try: client setup errors must not be logged away as a
+    # failed exchange
+    client = get_http_client()
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                GOOGLE_TOKEN_URL,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+        response = await client.post(
+            GOOGLE_TOKEN_URL,
+            data=data,
+            headers=_FORM_HEADERS,
+        )
+
+        if not response.is_success:
+            log.error(f"Token exchange failed with status {response.status_code}")
+            log.error(f"Response: {response.text}")
+            log.error(
+                f"Request data (without secret): code={code[:20]}..., client_id={GOOGLE_CLIENT_ID}, redirect_uri={GOOGLE_REDIRECT_URI}"
             )
+            return None
 
-            if response.status_code != 200:
-                log.error(f"Token exchange failed with status {response.status_code}")
-                log.error(f"Response: {response.text}")
-                log.error(
-                    f"Request data (without secret): code={code[:20]}..., client_id={GOOGLE_CLIENT_ID}, redirect_uri={GOOGLE_REDIRECT_URI}"
-                )
-                return None
-
-            tokens = response.json()
-            log.info("Successfully exchanged code for tokens")
-            return tokens
+        tokens = response.json()
+        log.info("Successfully exchanged code for tokens")
+        return tokens
 
     except Exception as e:
         log.error(f"Error exchanging code for tokens: {str(e)}")
@@ -163,22 +208,20 @@ async def get_google_user_info(access_token: str) -> Optional[Dict[str, Any]]:
     """
     log.info("Fetching user info from Google")
 
+    client = get_http_client()
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                GOOGLE_USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-
-            if response.status_code != 200:
-                log.error(f"Failed to fetch user info: {response.text}")
-                return None
-
-            user_info = response.json()
-            log.info(
-                f"Successfully fetched Google user info for: {user_info.get('email')}"
-            )
-            return user_info
+        response = await client.get(
+            GOOGLE_USERINFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        if not response.is_success:
+            log.error(f"Failed to fetch user info: {response.text}")
+            return None
+
+        user_info = response.json()
+        log.info(f"Successfully fetched Google user info for: {user_info.get('email')}")
+        return user_info
 
     except Exception as e:
         log.error(f"Error fetching Google user info: {str(e)}")
@@ -1,10 +1,16 @@
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 # Cache handlers to avoid re-creating them
 _handlers = {}
 
+# Background thread that drains the log queue into the real handlers
+_listener: QueueListener | None = None
+
 
 def get_file_handler(
     log_name: str, level: int, formatter: logging.Formatter, save_path: str = None
@@ -21,13 +27,48 @@ def get_file_handler(
     if full_path in _handlers:
         return _handlers[full_path]
 
-    file_handler = logging.FileHandler(filename=full_path, mode="a", encoding="utf-8")
+    # delay=True: the file is only opened on the first record
+    file_handler = logging.FileHandler(
+        filename=full_path, mode="a", encoding="utf-8", delay=True
+    )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     _handlers[full_path] = file_handler
     return file_handler
 
 
+def get_queue_handler(formatter: logging.Formatter) -> QueueHandler:
+    """
+    Shared QueueHandler; console and file writes happen on a listener thread,
+    so logging from a request never blocks the event loop on I/O.
+    """
+    global _listener
+    if "queue" in _handlers:
+        return _handlers["queue"]
+
+    # Console Handler (Shared)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.DEBUG)
+    console_handler.setFormatter(formatter)
+    _handlers["console"] = console_handler
+
+    # File Handler (Shared)
+    debug_handler = get_file_handler(
+        log_name="debug.log", level=logging.DEBUG, formatter=formatter
+    )
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, console_handler, debug_handler, respect_handler_level=True
+    )
+    _listener.start()
+    # Flush whatever is still queued on interpreter exit
+    atexit.register(_listener.stop)
+
+    _handlers["queue"] = QueueHandler(log_queue)
+    return _handlers["queue"]
+
+
 def config_logger(logger: logging.Logger):
     # If this logger already has handlers, don't add more
     if logger.handlers:
@@ -47,20 +88,8 @@ def config_logger(logger: logging.Logger):
         "[pid=%(process)s] - [%(asctime)s] - [%(name)s] - [%(levelname)s] - [%(message)s]"
     )
 
-    # Console Handler (Shared)
-    if "console" not in _handlers:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.DEBUG)
-        console_handler.setFormatter(formatter)
-        _handlers["console"] = console_handler
-
-    logger.addHandler(_handlers["console"])
-
-    # File Handler (Shared)
-    debug_handler = get_file_handler(
-        log_name="debug.log", level=logging.DEBUG, formatter=formatter
-    )
-    logger.addHandler(debug_handler)
+    # Queue Handler (Shared) -> console + debug.log
+    logger.addHandler(get_queue_handler(formatter))
 
     logger.setLevel(logging.DEBUG)
     return logger
@@ -0,0 +1,18 @@
+"""
+ObjectId Helpers
+================
+Parsing of client-supplied ObjectId strings.
+"""
+
+from typing import Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+def parse_object_id(value: str) -> Optional[ObjectId]:
+    """Parse an ObjectId string, returning None for malformed input."""
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        return None
@@ -0,0 +1,87 @@
+"""
+Cursor Pagination Utilities
+===========================
+Opaque keyset cursors for list endpoints ordered by (created_at, _id) desc.
+
+Unlike skip/limit, each page is an index range seek, so the cost of a page
+does not grow with how deep the client has paged.
+
+Cursor format (before base64url encoding): "<epoch_millis>:<object_id>"
+"""
+
+import base64
+import binascii
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+# Naive UTC epoch (all stored timestamps are naive UTC)
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+# Sort spec matching the (created_at, _id) desc cursor order
+CURSOR_SORT = [("created_at", -1), ("_id", -1)]
+
+
+def encode_cursor(created_at: datetime, oid: ObjectId) -> str:
+    """
+    Encode the position of a document as an opaque cursor string.
+
+    Args:
+        created_at: Document's created_at timestamp (naive UTC)
+        oid: Document's _id
+
+    Returns:
+        URL-safe base64 cursor
+    """
+    millis = (created_at - _EPOCH) // _ONE_MS
+    raw = f"{millis}:{oid}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: URL-safe base64 cursor
+
+    Returns:
+        Tuple of (created_at, _id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        millis, _, oid = base64.urlsafe_b64decode(padded).decode().partition(":")
+        return _EPOCH + int(millis) * _ONE_MS, ObjectId(oid)
+    except (binascii.Error, UnicodeDecodeError, InvalidId, TypeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def cursor_filter(cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the MongoDB filter selecting documents after a cursor.
+
+    Args:
+        cursor: Cursor from a previous page, or None for the first page
+
+    Returns:
+        MongoDB query dictionary (empty for the first page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return {}
+
+    created_at, oid = decode_cursor(cursor)
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": oid}},
+        ]
+    }
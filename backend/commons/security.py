@@ -31,11 +31,16 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 RESET_TOKEN_EXPIRE_MINUTES = int(os.getenv("RESET_TOKEN_EXPIRE_MINUTES", "60"))
 
-# Password hashing context with bcrypt (cost factor 12 as per documentation)
+# bcrypt cost factor: 12 as per documentation (~250ms per hash).
+# Test/dev environments may lower it (e.g. BCRYPT_ROUNDS=4); bcrypt's minimum
+# is 4. Verification cost follows the rounds stored in each hash.
+BCRYPT_ROUNDS = max(4, int(os.getenv("BCRYPT_ROUNDS", "12")))
+
+# Password hashing context with bcrypt
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12,  # ~250ms computation time for brute-force resistance
+    bcrypt__rounds=BCRYPT_ROUNDS,  # brute-force resistance vs. CPU per login
 )
 
 
@@ -29,6 +29,12 @@ from commons.security import (
     hash_password,
 )
 from commons.logger import logger
+from commons.google_oauth import (
+    exchange_code_for_tokens,
+    get_google_oauth_url,
+    get_google_user_info,
+    is_google_oauth_configured,
+)
 from commons.mail import send_verification_link
 from models.user_model import User
 
@@ -341,17 +347,22 @@ class AuthController:
         user_id: str,
         current_password: str,
         new_password: str,
+        role: str,
     ) -> Dict[str, Any]:
         """
         Change password for authenticated user.
 
+        Fresh tokens are returned so the client can carry on without
+        logging in again (which would cost another bcrypt verification).
+
         Args:
             user_id: Current user's ID
             current_password: Current password for verification
             new_password: New password (already validated by schema)
+            role: Current user's role (embedded in the new tokens)
 
         Returns:
-            Dictionary with success message
+            Dictionary with success message and new tokens
 
         Raises:
             HTTPException 400: If current password is wrong
@@ -380,7 +391,11 @@ class AuthController:
 
         log.info(f"Password changed successfully for: {user_id}")
 
-        return {"message": "Password changed successfully", "success": True}
+        return {
+            "message": "Password changed successfully",
+            "success": True,
+            "tokens": create_tokens(user_id=user_id, role=role),
+        }
 
     # =========================================================================
     # EMAIL VERIFICATION
@@ -496,11 +511,6 @@ class AuthController:
         Raises:
             HTTPException 500: If Google OAuth is not configured
         """
-        from commons.google_oauth import (
-            get_google_oauth_url,
-            is_google_oauth_configured,
-        )
-
         if not is_google_oauth_configured():
             log.error("Google OAuth not configured")
             raise HTTPException(
@@ -536,8 +546,6 @@ class AuthController:
             HTTPException 400: If code exchange fails
             HTTPException 403: If account is deactivated
         """
-        from commons.google_oauth import exchange_code_for_tokens, get_google_user_info
-
         log.info("Processing Google OAuth callback")
 
         # Parse state for intent
@@ -13,11 +13,14 @@ from cruds.booking_crud import booking_crud
 from cruds.service_crud import service_crud
 from cruds.user_crud import user_crud
 from models.user_model import User, UserRole
-from models.booking_model import BookingStatus
+from models.booking_model import BookingStatus, PaymentStatus, compute_end_time
 
 # Platform configuration
 PLATFORM_FEE_PERCENTAGE = 0.10  # 10% fee
 
+# Statuses from which a cleaner may mark a booking completed
+_COMPLETABLE_STATUSES = frozenset({BookingStatus.CONFIRMED, BookingStatus.IN_PROGRESS})
+
 
 class BookingController:
     """
@@ -95,21 +98,22 @@ class BookingController:
         """Get bookings for the current user."""
 
         if user.role == UserRole.CUSTOMER:
-            bookings = await booking_crud.get_customer_bookings(
-                customer_id=str(user.id), skip=skip, limit=limit, status=status
-            )
+            match: Dict[str, Any] = {"customer_id": str(user.id)}
         else:
-            bookings = await booking_crud.get_cleaner_bookings(
-                cleaner_id=str(user.id), skip=skip, limit=limit, status=status
-            )
+            match = {"cleaner_id": str(user.id)}
+        if status:
+            try:
+                match["status"] = {"$in": BookingStatus(status).stored_values}
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid booking status")
 
-        bookings_data = [self._booking_to_dict(b) for b in bookings]
+        # Bookings and related names come back from a single aggregation
+        docs = await booking_crud.get_bookings_with_refs(match, skip=skip, limit=limit)
+        bookings_data = [self._booking_doc_to_dict(doc) for doc in docs]
 
-        # TODO: Enhance bookings with related entity names (Customer/Cleaner name)
-        # For now, return raw bookings
         return {
             "bookings": bookings_data,
-            "total": len(bookings),  # improved: count properly in CRUD later
+            "total": len(bookings_data),  # improved: count properly in CRUD later
             "page": (skip // limit) + 1,
             "size": limit,
         }
@@ -120,6 +124,11 @@ class BookingController:
         """
         Update booking status with permission checks.
         """
+        try:
+            new_status = BookingStatus(new_status)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid booking status")
+
         booking = await booking_crud.get_booking_by_id(booking_id)
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -163,10 +172,7 @@ class BookingController:
                 raise HTTPException(
                     status_code=403, detail="Only cleaner can complete booking"
                 )
-            if (
-                booking.status != BookingStatus.IN_PROGRESS
-                and booking.status != BookingStatus.CONFIRMED
-            ):
+            if booking.status not in _COMPLETABLE_STATUSES:
                 raise HTTPException(
                     status_code=400,
                     detail="Booking must be confirmed or in progress to complete",
@@ -198,7 +204,7 @@ class BookingController:
             "start_time": booking.start_time,
             "end_time": booking.end_time,
             "duration_hours": booking.duration_hours,
-            "status": booking.status.value,
+            "status": booking.status.label,
             "payment_status": booking.payment_status.value,
             "total_price": booking.total_price,
             "service_price": booking.service_price,
@@ -209,5 +215,35 @@ class BookingController:
             "updated_at": booking.updated_at,
         }
 
+    def _booking_doc_to_dict(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a raw bookings document to the API dictionary.
+
+        Read-only list path: skips building a Booking model per row. Must
+        produce the same keys as _booking_to_dict (plus joined names).
+        """
+        return {
+            "id": str(doc["_id"]),
+            "customer_id": doc["customer_id"],
+            "cleaner_id": doc["cleaner_id"],
+            "service_id": doc["service_id"],
+            "scheduled_date": doc["scheduled_date"].date(),
+            "start_time": doc["start_time"],
+            "end_time": compute_end_time(doc["start_time"], doc["duration_hours"]),
+            "duration_hours": doc["duration_hours"],
+            "status": BookingStatus(doc["status"]).label,
+            "payment_status": doc.get("payment_status", PaymentStatus.PENDING.value),
+            "total_price": doc["total_price"],
+            "service_price": doc["service_price"],
+            "platform_fee": doc["platform_fee"],
+            "address": doc["address"],
+            "special_instructions": doc.get("special_instructions"),
+            "created_at": doc["created_at"],
+            "updated_at": doc["updated_at"],
+            "customer_name": doc.get("customer_name"),
+            "cleaner_name": doc.get("cleaner_name"),
+            "service_name": doc.get("service_name"),
+        }
+
 
 booking_controller = BookingController()
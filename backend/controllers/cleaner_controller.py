@@ -11,6 +11,8 @@ Handles:
 - Find nearby cleaners (location-based)
 """
 
+import asyncio
+import traceback
 from typing import Dict, Any, Optional, List
 from fastapi import HTTPException, status
 
@@ -18,7 +20,7 @@ from cruds.cleaner_crud import cleaner_crud
 from cruds.user_crud import user_crud
 from commons.logger import logger
 from models.user_model import User
-from models.cleaner_profile_model import CleanerProfile
+from models.cleaner_profile_model import CleanerProfile, to_service_category
 
 # Initialize logger
 log = logger(__name__)
@@ -133,8 +135,6 @@ class CleanerController:
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
         except Exception as e:
-            import traceback
-
             log.error(f"Profile creation error for {user.email}: {str(e)}")
             log.error(traceback.format_exc())
             raise HTTPException(
@@ -335,10 +335,7 @@ class CleanerController:
         )
 
         # Enrich profiles with user info (name, profile pic)
-        enriched = []
-        for profile in profiles:
-            user = await user_crud.get_user_by_id(profile.user_id)
-            enriched.append(self._profile_to_public_dict(profile, user))
+        enriched = await self._profiles_with_users(profiles)
 
         return {
             "cleaners": enriched,
@@ -356,6 +353,7 @@ class CleanerController:
         longitude: float,
         radius_km: float = 10.0,
         limit: int = 20,
+        specialization: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Find cleaners near a given location.
@@ -365,6 +363,7 @@ class CleanerController:
             longitude: Center point longitude
             radius_km: Search radius in km (max 50)
             limit: Max results (max 50)
+            specialization: Optional service category filter
 
         Returns:
             Dictionary with nearby cleaners list
@@ -378,18 +377,27 @@ class CleanerController:
         radius_km = min(radius_km, 50.0)
         limit = min(limit, 50)
 
+        # Validate the client's filter up front; a ValueError from reading
+        # profile documents below is a server error, not a bad request
+        specializations = None
+        if specialization:
+            try:
+                specializations = [to_service_category(specialization).value]
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+
         profiles = await cleaner_crud.find_nearby_cleaners(
             latitude=latitude,
             longitude=longitude,
             radius_km=radius_km,
             limit=limit,
+            specializations=specializations,
         )
 
         # Enrich with user info
-        enriched = []
-        for profile in profiles:
-            user = await user_crud.get_user_by_id(profile.user_id)
-            enriched.append(self._profile_to_public_dict(profile, user))
+        enriched = await self._profiles_with_users(profiles)
 
         return {
             "cleaners": enriched,
@@ -438,6 +446,22 @@ class CleanerController:
             ),
         }
 
+    async def _profiles_with_users(
+        self, profiles: List[CleanerProfile]
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert profiles to public dictionaries with user info attached.
+
+        User lookups are issued concurrently instead of one after another.
+        """
+        users = await asyncio.gather(
+            *(user_crud.get_user_by_id(profile.user_id) for profile in profiles)
+        )
+        return [
+            self._profile_to_public_dict(profile, user)
+            for profile, user in zip(profiles, users)
+        ]
+
     def _profile_to_public_dict(
         self, profile: CleanerProfile, user: Optional[User] = None
     ) -> Dict[str, Any]:
@@ -9,13 +9,16 @@ Handles:
 - Review search & listing
 """
 
+import asyncio
 from typing import Dict, Any, List, Optional
 from fastapi import HTTPException, status
+from odmantic.exceptions import DuplicateKeyError
 
 from cruds.review_crud import review_crud
 from cruds.booking_crud import booking_crud
 from cruds.cleaner_crud import cleaner_crud
 from cruds.user_crud import user_crud
+from commons.pagination import encode_cursor
 from models.user_model import User, UserRole
 from models.booking_model import BookingStatus
 
@@ -64,73 +67,88 @@ class ReviewController:
                 detail="You can only review completed bookings",
             )
 
-        # 4. Duplicate Check
-        existing_review = await review_crud.get_review_by_booking(booking_id)
-        if existing_review:
+        # 4. Create Review
+        # Duplicates are rejected by the unique booking_id index
+        try:
+            review = await review_crud.create_review(
+                booking_id=booking_id,
+                customer_id=customer_id,
+                cleaner_id=booking.cleaner_id,
+                rating=rating,
+                comment=comment,
+            )
+        except DuplicateKeyError:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="You have already reviewed this booking",
             )
 
-        # Create Review
-        review = await review_crud.create_review(
-            booking_id=booking_id,
-            customer_id=customer_id,
-            cleaner_id=booking.cleaner_id,
-            rating=rating,
-            comment=comment,
-        )
-
         # 5. Update Cleaner Profile Stats
         # This is CRITICAL for search ranking
-        await self._update_cleaner_stats(booking.cleaner_id)
+        await cleaner_crud.add_review_rating(booking.cleaner_id, rating)
 
         return self._review_to_dict(review)
 
     async def get_cleaner_reviews(
-        self, cleaner_id: str, skip: int = 0, limit: int = 20
+        self,
+        cleaner_id: str,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get public reviews for a cleaner.
-        """
-        reviews = await review_crud.get_reviews_by_cleaner(
-            cleaner_id=cleaner_id, skip=skip, limit=limit
-        )
 
+        If a cursor is given, skip is ignored and the page is fetched by
+        keyset seek. Every response carries next_cursor for the next page;
+        page is only included in skip/limit mode.
+        """
         total = await review_crud.get_total_reviews(cleaner_id)
 
-        # Enrich reviews with customer names
+        if cursor:
+            try:
+                reviews, next_cursor = await review_crud.get_reviews_page(
+                    cleaner_id=cleaner_id, limit=limit, cursor=cursor
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+        else:
+            reviews = await review_crud.get_reviews_by_cleaner(
+                cleaner_id=cleaner_id, skip=skip, limit=limit
+            )
+            next_cursor = None
+            if reviews and skip + len(reviews) < total:
+                next_cursor = encode_cursor(reviews[-1].created_at, reviews[-1].id)
+
+        # Enrich reviews with customer names (lookups run concurrently)
+        customers = await asyncio.gather(
+            *(user_crud.get_user_by_id(r.customer_id) for r in reviews)
+        )
         reviews_data = []
-        for r in reviews:
+        for r, customer in zip(reviews, customers):
             data = self._review_to_dict(r)
-            customer = await user_crud.get_user_by_id(r.customer_id)
-            if customer:
-                # Only show first name for privacy? Or full name?
-                # For now, full name
-                data["customer_name"] = customer.full_name
+            # Only show first name for privacy? Or full name?
+            # For now, full name (always set: the route excludes unset fields)
+            data["customer_name"] = customer.full_name if customer else None
             reviews_data.append(data)
 
-        # Get current stats (for avg_rating)
-        avg_rating, _ = await review_crud.get_cleaner_stats(cleaner_id)
+        # Current average is kept up to date on the cleaner profile
+        profile = await cleaner_crud.get_profile_by_user_id(cleaner_id)
+        avg_rating = profile.avg_rating if profile else 0.0
 
-        return {
+        result = {
             "reviews": reviews_data,
             "total": total,
-            "page": (skip // limit) + 1,
             "size": limit,
             "avg_rating": avg_rating,
+            "next_cursor": next_cursor,
         }
-
-    async def _update_cleaner_stats(self, cleaner_id: str):
-        """
-        Recalculate and update cleaner's profile ratings.
-        """
-        avg_rating, total_reviews = await review_crud.get_cleaner_stats(cleaner_id)
-
-        # Update using specific method for ratings
-        await cleaner_crud.update_rating(
-            user_id=cleaner_id, new_avg=avg_rating, total_reviews=total_reviews
-        )
+        # A page number only means something in skip/limit mode
+        if not cursor:
+            result["page"] = (skip // limit) + 1
+        return result
 
     def _review_to_dict(self, review: Any) -> Dict[str, Any]:
         """Convert Review object to dictionary."""
@@ -11,6 +11,7 @@ Handles:
 - Search services (by category, price range)
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from fastapi import HTTPException, status
 
@@ -369,7 +370,8 @@ class ServiceController:
         # Cap limit
         limit = min(limit, 50)
 
-        services = await service_crud.search_services(
+        # Page and total come back from a single aggregation
+        services, total = await service_crud.search_services_with_count(
             category=category,
             min_price=min_price,
             max_price=max_price,
@@ -380,19 +382,11 @@ class ServiceController:
             sort_by=sort_by,
         )
 
-        total = await service_crud.count_services(
-            category=category,
-            min_price=min_price,
-            max_price=max_price,
-            price_type=price_type,
-            active_only=True,
+        # Enrich with cleaner info (lookups run concurrently)
+        enriched = await asyncio.gather(
+            *(self._service_with_cleaner(service) for service in services)
         )
 
-        # Enrich with cleaner info
-        enriched = []
-        for service in services:
-            enriched.append(await self._service_with_cleaner(service))
-
         return {
             "services": enriched,
             "pagination": {
@@ -437,8 +431,10 @@ class ServiceController:
         data = self._service_to_dict(service)
 
         # Add cleaner info
-        user = await user_crud.get_user_by_id(service.cleaner_id)
-        profile = await cleaner_crud.get_profile_by_user_id(service.cleaner_id)
+        user, profile = await asyncio.gather(
+            user_crud.get_user_by_id(service.cleaner_id),
+            cleaner_crud.get_profile_by_user_id(service.cleaner_id),
+        )
 
         data["cleaner_name"] = user.full_name if user else None
         data["cleaner_rating"] = profile.avg_rating if profile else 0.0
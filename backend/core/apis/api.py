@@ -20,6 +20,8 @@ from core.apis.routers.payment_router import router as payment_router
 
 # Import database functions
 from database.database import connect_to_mongo, close_mongo_connection
+from database.indexes import ensure_indexes
+from commons.google_oauth import close_http_client
 
 
 # =============================================================================
@@ -32,13 +34,15 @@ async def lifespan(app: FastAPI):
     """
     Manage application startup and shutdown events.
 
-    - On startup: Connect to MongoDB
-    - On shutdown: Close MongoDB connection
+    - On startup: Connect to MongoDB and build the collection indexes
+    - On shutdown: Close MongoDB connection and the shared OAuth HTTP client
     """
     # Startup
     await connect_to_mongo()
+    await ensure_indexes()
     yield
     # Shutdown
+    await close_http_client()
     await close_mongo_connection()
 
 
@@ -290,9 +290,9 @@ async def reset_password(request: ResetPasswordRequest):
 
 @router.post(
     "/change-password",
-    response_model=MessageResponse,
+    response_model=None,
     summary="Change password",
-    description="Change password for authenticated user.",
+    description="Change password for authenticated user. Returns fresh tokens.",
     responses={
         200: {
             "description": "Password changed successfully",
@@ -301,6 +301,12 @@ async def reset_password(request: ResetPasswordRequest):
                     "example": {
                         "message": "Password changed successfully",
                         "success": True,
+                        "tokens": {
+                            "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                            "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                            "token_type": "bearer",
+                            "expires_in": 1800,
+                        },
                     }
                 }
             },
@@ -319,11 +325,14 @@ async def change_password(
 
     - **current_password**: Current password for verification
     - **new_password**: New password (must meet strength requirements)
+
+    Returns new access/refresh tokens, so no re-login is needed.
     """
     result = await auth_controller.change_password(
         user_id=str(current_user.id),
         current_password=request.current_password,
         new_password=request.new_password,
+        role=current_user.role.value,
     )
 
     return result
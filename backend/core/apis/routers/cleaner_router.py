@@ -327,6 +327,10 @@ async def find_nearby(
         default=10.0, ge=1.0, le=50.0, description="Search radius in km"
     ),
     limit: int = Query(default=20, ge=1, le=50, description="Max results"),
+    specialization: Optional[str] = Query(
+        default=None,
+        description="Filter by specialization: regular, deep, move_in_out, office, specialized",
+    ),
 ):
     """
     Find cleaners near a location.
@@ -337,12 +341,14 @@ async def find_nearby(
     - **latitude**: Your latitude (-90 to 90)
     - **longitude**: Your longitude (-180 to 180)
     - **radius_km**: Search radius (1-50 km)
+    - **specialization**: Only show cleaners offering this service type
     """
     return await cleaner_controller.find_nearby(
         latitude=latitude,
         longitude=longitude,
         radius_km=radius_km,
         limit=limit,
+        specialization=specialization,
     )
 
 
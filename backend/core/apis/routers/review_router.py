@@ -6,7 +6,7 @@ Prefix: /api/reviews
 """
 
 from fastapi import APIRouter, Depends, Query, status
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from controllers.review_controller import review_controller
 from commons.dependencies import require_customer, get_current_user
@@ -58,6 +58,7 @@ async def create_review(
 @router.get(
     "/cleaner/{cleaner_id}",
     response_model=ReviewListResponse,
+    response_model_exclude_unset=True,
     summary="Get cleaner reviews",
     description="Get public reviews for a specific cleaner.",
 )
@@ -65,6 +66,9 @@ async def get_cleaner_reviews(
     cleaner_id: str,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=50),
+    cursor: Optional[str] = Query(
+        default=None, description="next_cursor from the previous page (overrides skip)"
+    ),
 ):
     """
     Get reviews for a cleaner.
@@ -74,4 +78,5 @@ async def get_cleaner_reviews(
         cleaner_id=cleaner_id,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
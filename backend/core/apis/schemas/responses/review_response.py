@@ -38,7 +38,8 @@ class ReviewListResponse(BaseModel):
 
     reviews: List[ReviewResponse]
     total: int
-    page: int
+    page: Optional[int] = None  # Omitted when paging by cursor
     size: int
 
     avg_rating: float  # Current average for the cleaner
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the next page
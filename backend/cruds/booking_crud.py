@@ -5,14 +5,68 @@ Database operations for Booking model using ODMantic.
 Handles booking creation, retrieval, and status updates.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from datetime import datetime, time
 from bson import ObjectId
 from odmantic import AIOEngine
 
-from models.booking_model import Booking, BookingStatus, BookingAddress
+from models.booking_model import (
+    ACTIVE_STATUSES,
+    Booking,
+    BookingStatus,
+    BookingAddress,
+    schedule_epoch,
+)
 from database.database import get_engine
 
+# Upper bound on a booking's length (service duration_hours is capped at 24).
+# Lets the overlap query use a bounded range on scheduled_at_epoch.
+MAX_BOOKING_SECONDS = 24 * 3600
+
+# Stored values of the slot-holding statuses, for $in filters: the int codes
+# plus the legacy strings ("pending", ...) of documents not yet converted
+# by scripts/migrate_data.py
+_ACTIVE_STATUS_VALUES = [v for s in sorted(ACTIVE_STATUSES) for v in s.stored_values]
+
+
+def _ref_lookup(
+    collection: str, local_field: str, as_field: str, projection: Dict[str, int]
+) -> Dict[str, Any]:
+    """
+    Build a $lookup stage joining a string id field to another collection's _id.
+
+    Reference ids are stored as strings, so the join converts them with
+    $convert (bad ids become null instead of failing the pipeline) and
+    matches on _id, which keeps the lookup on the _id index.
+    """
+    return {
+        "$lookup": {
+            "from": collection,
+            "let": {"ref_id": f"${local_field}"},
+            "pipeline": [
+                {
+                    "$match": {
+                        "$expr": {
+                            "$eq": [
+                                "$_id",
+                                {
+                                    "$convert": {
+                                        "input": "$$ref_id",
+                                        "to": "objectId",
+                                        "onError": None,
+                                        "onNull": None,
+                                    }
+                                },
+                            ]
+                        }
+                    }
+                },
+                {"$project": projection},
+            ],
+            "as": as_field,
+        }
+    }
+
 
 class BookingCRUD:
     """
@@ -59,6 +113,7 @@ class BookingCRUD:
             longitude=address.get("longitude"),
         )
 
+        now = datetime.utcnow()
         booking = Booking(
             customer_id=customer_id,
             cleaner_id=cleaner_id,
@@ -72,8 +127,8 @@ class BookingCRUD:
             status=BookingStatus.PENDING,
             address=booking_address,
             special_instructions=special_instructions,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
         # Save to database
@@ -103,17 +158,61 @@ class BookingCRUD:
         """Get all bookings for a customer."""
         filters = [Booking.customer_id == customer_id]
         if status:
-            filters.append(Booking.status == status)
+            filters.append(Booking.status == BookingStatus(status))
 
         bookings = await self.engine.find(
             Booking,
             *filters,
             sort=Booking.scheduled_date.desc(),
             skip=skip,
-            limit=limit
+            limit=limit,
         )
         return bookings
 
+    async def get_bookings_with_refs(
+        self,
+        match: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get bookings together with customer, cleaner and service names.
+
+        Runs one aggregation with $lookup stages instead of fetching the
+        related User/ServicePackage documents per booking. Documents are
+        returned raw (no ODMantic model validation) for read-only listing.
+
+        Args:
+            match: Raw MongoDB filter on the bookings collection
+            skip: Pagination offset
+            limit: Maximum results
+
+        Returns:
+            List of raw booking documents with customer_name, cleaner_name
+            and service_name added (None if the ref is missing)
+        """
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"scheduled_date": -1, "_id": -1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            _ref_lookup("users", "customer_id", "_customer", {"full_name": 1}),
+            _ref_lookup("users", "cleaner_id", "_cleaner", {"full_name": 1}),
+            _ref_lookup("services", "service_id", "_service", {"name": 1}),
+        ]
+
+        collection = self.engine.get_collection(Booking)
+        docs = await collection.aggregate(pipeline).to_list(length=limit)
+
+        for doc in docs:
+            customer = doc.pop("_customer")
+            cleaner = doc.pop("_cleaner")
+            service = doc.pop("_service")
+            doc["customer_name"] = customer[0].get("full_name") if customer else None
+            doc["cleaner_name"] = cleaner[0].get("full_name") if cleaner else None
+            doc["service_name"] = service[0].get("name") if service else None
+        return docs
+
     async def get_cleaner_bookings(
         self,
         cleaner_id: str,
@@ -124,14 +223,14 @@ class BookingCRUD:
         """Get all bookings for a cleaner (schedule)."""
         filters = [Booking.cleaner_id == cleaner_id]
         if status:
-            filters.append(Booking.status == status)
+            filters.append(Booking.status == BookingStatus(status))
 
         bookings = await self.engine.find(
             Booking,
             *filters,
             sort=Booking.scheduled_date.desc(),
             skip=skip,
-            limit=limit
+            limit=limit,
         )
         return bookings
 
@@ -142,42 +241,47 @@ class BookingCRUD:
         Check if a cleaner is available at specific date/time.
         Returns True if available, False if already booked.
         """
-        # Find all confirmed or pending bookings for this cleaner on this date
-        # Note: We query strictly by date first for performance
-        # Using >= date and < date+1day
-        start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        bookings = await self.engine.find(
-            Booking,
-            Booking.cleaner_id == cleaner_id,
-            Booking.scheduled_date >= start_of_day,
-            Booking.scheduled_date <= end_of_day,
-            Booking.status.in_(
-                [
-                    BookingStatus.PENDING,
-                    BookingStatus.CONFIRMED,
-                    BookingStatus.IN_PROGRESS,
-                ]
-            ),
-        )
-
-        # Simple time overlap check
-        # Convert times to float hours for easier comparison (e.g., "14:30" -> 14.5)
-        def time_to_float(t_str: str) -> float:
-            h, m = map(int, t_str.split(":"))
-            return h + m / 60.0
-
-        new_start = time_to_float(start_time)
-        new_end = new_start + duration_hours
-
-        for booking in bookings:
-            existing_start = time_to_float(booking.start_time)
-            existing_end = existing_start + booking.duration_hours
+        # Work in epoch seconds so bookings that cross midnight are handled
+        new_start = schedule_epoch(date, start_time)
+        new_end = new_start + int(duration_hours * 3600)
+
+        # Only bookings starting in (new_start - max length, new_end) can
+        # overlap; this is a single range scan on the availability index
+        window_start = new_start - MAX_BOOKING_SECONDS
+        query = {
+            "cleaner_id": cleaner_id,
+            "status": {"$in": _ACTIVE_STATUS_VALUES},
+            "$or": [
+                {"scheduled_at_epoch": {"$gt": window_start, "$lt": new_end}},
+                # Bookings not yet back-filled by scripts/migrate_data.py:
+                # narrow by date, compute the epoch below
+                {
+                    "scheduled_at_epoch": {"$exists": False},
+                    "scheduled_date": {
+                        "$gt": datetime.utcfromtimestamp(window_start - 86400),
+                        "$lt": datetime.utcfromtimestamp(new_end),
+                    },
+                },
+            ],
+        }
+        projection = {
+            "scheduled_at_epoch": 1,
+            "scheduled_date": 1,
+            "start_time": 1,
+            "duration_hours": 1,
+        }
+
+        cursor = self.engine.get_collection(Booking).find(query, projection)
+        async for doc in cursor:
+            existing_start = doc.get("scheduled_at_epoch")
+            if existing_start is None:
+                existing_start = schedule_epoch(
+                    doc["scheduled_date"], doc["start_time"]
+                )
+            existing_end = existing_start + int(doc["duration_hours"] * 3600)
 
-            # Check for overlap
             # Overlap logic: (StartA < EndB) and (EndA > StartB)
-            if new_start < existing_end and new_end > existing_start:
+            if existing_start < new_end and existing_end > new_start:
                 return False  # Overlap found, not available
 
         return True
@@ -198,6 +302,8 @@ class BookingCRUD:
         if not booking:
             return None
 
+        # Accepts either a BookingStatus or its API name (e.g. "cancelled")
+        new_status = BookingStatus(new_status)
         booking.status = new_status
         booking.updated_at = datetime.utcnow()
 
@@ -10,7 +10,12 @@ from datetime import datetime
 from bson import ObjectId
 from odmantic import AIOEngine
 
-from models.cleaner_profile_model import CleanerProfile, ServiceCategory, Location
+from models.cleaner_profile_model import (
+    CleanerProfile,
+    ServiceCategory,
+    rating_to_x100,
+    to_service_category,
+)
 from database.database import get_engine
 import logging
 
@@ -71,19 +76,19 @@ class CleanerCRUD:
         if existing:
             raise ValueError(f"Cleaner profile already exists for user {user_id}")
 
-        # Build location if coordinates are provided
-        location = None
+        # Build location if coordinates are provided ([lng, lat] order)
+        loc = None
         lat = profile_data.get("latitude")
         lng = profile_data.get("longitude")
         if lat is not None and lng is not None:
-            location = Location(type="Point", coordinates=[lng, lat])
+            loc = [lng, lat]
 
         # Convert specialization strings to enums
         specializations = []
         spec_list = profile_data.get("specializations", ["regular"])
         for spec in spec_list:
             try:
-                specializations.append(ServiceCategory(spec.lower()).value)
+                specializations.append(to_service_category(spec).value)
             except ValueError:
                 # Default to regular if invalid
                 specializations.append(ServiceCategory.REGULAR.value)
@@ -100,15 +105,12 @@ class CleanerCRUD:
             "city": profile_data.get("city", "").strip(),
             "state": profile_data.get("state"),
             "pincode": profile_data.get("pincode"),
-            "location": (
-                {"type": location.type, "coordinates": location.coordinates}
-                if location
-                else None
-            ),
+            "loc": loc,
             "service_radius_km": profile_data.get("service_radius_km", 10.0),
             "is_available": True,
             "verified": False,
-            "avg_rating": 0.0,
+            "avg_rating_x100": 0,
+            "rating_sum": 0,
             "total_reviews": 0,
             "completed_jobs": 0,
             "created_at": now,
@@ -162,11 +164,11 @@ class CleanerCRUD:
             filters.append(CleanerProfile.city == city.strip())
 
         if specialization:
-            category = ServiceCategory(specialization.lower())
+            category = to_service_category(specialization)
             filters.append(CleanerProfile.specializations == category)
 
         if min_rating is not None:
-            filters.append(CleanerProfile.avg_rating >= min_rating)
+            filters.append(CleanerProfile.avg_rating_x100 >= rating_to_x100(min_rating))
 
         if is_available is not None:
             filters.append(CleanerProfile.is_available == is_available)
@@ -185,7 +187,7 @@ class CleanerCRUD:
         # Sort results
         result = list(profiles)
         if sort_by == "rating":
-            result.sort(key=lambda p: p.avg_rating, reverse=True)
+            result.sort(key=lambda p: p.avg_rating_x100, reverse=True)
         elif sort_by == "experience":
             result.sort(key=lambda p: p.experience_years, reverse=True)
         elif sort_by == "reviews":
@@ -210,11 +212,11 @@ class CleanerCRUD:
             filters.append(CleanerProfile.city == city.strip())
 
         if specialization:
-            category = ServiceCategory(specialization.lower())
+            category = to_service_category(specialization)
             filters.append(CleanerProfile.specializations == category)
 
         if min_rating is not None:
-            filters.append(CleanerProfile.avg_rating >= min_rating)
+            filters.append(CleanerProfile.avg_rating_x100 >= rating_to_x100(min_rating))
 
         if is_available is not None:
             filters.append(CleanerProfile.is_available == is_available)
@@ -233,11 +235,23 @@ class CleanerCRUD:
         longitude: float,
         radius_km: float = 10.0,
         limit: int = 20,
+        specializations: Optional[List[str]] = None,
     ) -> List[CleanerProfile]:
-        """Find cleaners near a given location."""
+        """
+        Find available cleaners near a given location, nearest first.
+
+        Filtering and distance ordering both happen inside $geoNear (on the
+        2dsphere index); profiles are built straight from the returned docs.
+        """
         # MongoDB $geoNear requires distance in meters
         radius_meters = radius_km * 1000
 
+        query: Dict[str, Any] = {"is_available": True}
+        if specializations:
+            query["specializations"] = {
+                "$in": [to_service_category(spec).value for spec in specializations]
+            }
+
         collection = self.engine.get_collection(CleanerProfile)
         pipeline = [
             {
@@ -249,22 +263,16 @@ class CleanerCRUD:
                     "distanceField": "distance_meters",
                     "maxDistance": radius_meters,
                     "spherical": True,
-                    "query": {"is_available": True},
+                    "query": query,
+                    "key": "loc",
                 }
             },
             {"$limit": limit},
         ]
 
-        results = []
-        async for doc in collection.aggregate(pipeline):
-            try:
-                profile = await self.get_profile_by_id(str(doc["_id"]))
-                if profile:
-                    results.append(profile)
-            except Exception:
-                continue
-
-        return results
+        docs = await collection.aggregate(pipeline).to_list(length=limit)
+        # $geoNear already returns full documents in distance order
+        return [CleanerProfile.model_validate_doc(doc) for doc in docs]
 
     # =========================================================================
     # UPDATE Operations
@@ -305,7 +313,7 @@ class CleanerCRUD:
             specs = []
             for spec in update_data["specializations"]:
                 try:
-                    specs.append(ServiceCategory(spec.lower()).value)
+                    specs.append(to_service_category(spec).value)
                 except ValueError:
                     pass
             set_fields["specializations"] = specs
@@ -314,10 +322,7 @@ class CleanerCRUD:
         lat = update_data.get("latitude")
         lng = update_data.get("longitude")
         if lat is not None and lng is not None:
-            set_fields["location"] = {
-                "type": "Point",
-                "coordinates": [lng, lat],
-            }
+            set_fields["loc"] = [lng, lat]
 
         # Update timestamp
         set_fields["updated_at"] = datetime.utcnow()
@@ -344,26 +349,49 @@ class CleanerCRUD:
         )
         return await self.get_profile_by_user_id(user_id)
 
-    async def update_rating(
-        self, user_id: str, new_avg: float, total_reviews: int
-    ) -> Optional[CleanerProfile]:
-        """Update cleaner's rating stats."""
-        profile = await self.get_profile_by_user_id(user_id)
-        if not profile:
-            return None
+    async def add_review_rating(self, user_id: str, rating: int) -> bool:
+        """
+        Fold one new review into the cleaner's rating stats.
+
+        A single atomic update: rating_sum and total_reviews are incremented
+        and avg_rating_x100 is re-derived from them, so no scan over the
+        cleaner's reviews is needed.
+
+        Returns:
+            True if the profile was found, False otherwise
+        """
+        # Profiles not yet migrated by recompute_cleaner_rating_stats have no
+        # rating_sum: seed it from the stored average * review count (the
+        # avg_rating_x100 form, or the legacy float avg_rating)
+        stored_avg = {
+            "$ifNull": [
+                {"$divide": ["$avg_rating_x100", 100]},
+                {"$ifNull": ["$avg_rating", 0]},
+            ]
+        }
+        stored_sum = {"$multiply": [stored_avg, {"$ifNull": ["$total_reviews", 0]}]}
+        seed_sum = {"$floor": {"$add": [stored_sum, 0.5]}}
+        rating_sum = {"$add": [{"$ifNull": ["$rating_sum", seed_sum]}, rating]}
+        total_reviews = {"$add": [{"$ifNull": ["$total_reviews", 0]}, 1]}
+        # Hundredths, rounded half up (same as rating_to_x100)
+        mean_x100 = {"$divide": [{"$multiply": ["$rating_sum", 100]}, "$total_reviews"]}
+        avg_x100 = {"$floor": {"$add": [mean_x100, 0.5]}}
 
         collection = self.engine.get_collection(CleanerProfile)
-        await collection.update_one(
-            {"_id": profile.id},
-            {
-                "$set": {
-                    "avg_rating": round(new_avg, 2),
-                    "total_reviews": total_reviews,
-                    "updated_at": datetime.utcnow(),
-                }
-            },
+        result = await collection.update_one(
+            {"user_id": user_id},
+            [
+                {
+                    "$set": {
+                        "rating_sum": rating_sum,
+                        "total_reviews": total_reviews,
+                        "updated_at": datetime.utcnow(),
+                    }
+                },
+                {"$set": {"avg_rating_x100": {"$toInt": avg_x100}}},
+            ],
         )
-        return await self.get_profile_by_user_id(user_id)
+        return result.matched_count > 0
 
     async def increment_completed_jobs(self, user_id: str) -> Optional[CleanerProfile]:
         """Increment completed jobs count."""
@@ -7,13 +7,16 @@ Handles:
 - Creating new payment records
 - Updating payment status
 - Fetching payments by booking or IDs
+- Storing raw gateway responses (separate payment_gateway_logs collection)
 """
 
 from typing import Optional, List
 from datetime import datetime
+from bson import ObjectId
 from odmantic import AIOEngine
 
 from models.payment_model import Payment, PaymentStatus
+from models.gateway_log_model import GatewayLog
 from database.database import get_engine
 
 
@@ -58,8 +61,6 @@ class PaymentCRUD:
         # Note: In real app, we use ObjectId, here assuming string ID
         # Since odmantic handles ObjectId/str conversion, we can query by ID directly
         try:
-            from bson import ObjectId
-
             return await self.engine.find_one(
                 Payment, Payment.id == ObjectId(payment_id)
             )
@@ -95,12 +96,39 @@ class PaymentCRUD:
             return None
 
         payment.status = status
-        if gateway_response:
-            payment.gateway_response = gateway_response
         payment.updated_at = datetime.utcnow()
 
         await self.engine.save(payment)
+
+        if gateway_response:
+            await self.save_gateway_log(
+                str(payment.id), payment.transaction_id, gateway_response
+            )
         return payment
 
+    async def save_gateway_log(
+        self, payment_id: str, transaction_id: Optional[str], response: dict
+    ) -> None:
+        """Store (or replace) the raw gateway response for a payment."""
+        now = datetime.utcnow()
+        await self.engine.get_collection(GatewayLog).update_one(
+            {"payment_id": payment_id},
+            {
+                "$set": {
+                    "transaction_id": transaction_id,
+                    "response": response,
+                    "updated_at": now,
+                },
+                "$setOnInsert": {"created_at": now},
+            },
+            upsert=True,
+        )
+
+    async def get_gateway_log(self, payment_id: str) -> Optional[GatewayLog]:
+        """Fetch the raw gateway response for a payment (on demand)."""
+        return await self.engine.find_one(
+            GatewayLog, GatewayLog.payment_id == payment_id
+        )
+
 
 payment_crud = PaymentCRUD()
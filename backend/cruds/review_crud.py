@@ -14,6 +14,7 @@ from datetime import datetime
 from odmantic import AIOEngine
 
 from models.review_model import Review
+from commons.pagination import CURSOR_SORT, cursor_filter, encode_cursor
 from database.database import get_engine
 
 
@@ -37,7 +38,13 @@ class ReviewCRUD:
         rating: int,
         comment: Optional[str] = None,
     ) -> Review:
-        """Create and save a new review."""
+        """
+        Create and save a new review.
+
+        Raises:
+            DuplicateKeyError: If the booking already has a review
+                (unique booking_id index)
+        """
         review = Review(
             booking_id=booking_id,
             customer_id=customer_id,
@@ -57,12 +64,46 @@ class ReviewCRUD:
         reviews = await self.engine.find(
             Review,
             Review.cleaner_id == cleaner_id,
-            sort=Review.created_at.desc(),
+            sort=(Review.created_at.desc(), Review.id.desc()),
             skip=skip,
             limit=limit,
         )
         return reviews
 
+    async def get_reviews_page(
+        self, cleaner_id: str, limit: int = 20, cursor: Optional[str] = None
+    ) -> Tuple[List[Review], Optional[str]]:
+        """
+        Get a page of reviews for a cleaner using keyset pagination.
+
+        Seeks on (created_at, _id) instead of skipping, so deep pages cost
+        the same as the first one.
+
+        Returns:
+            Tuple of (reviews, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = {"cleaner_id": cleaner_id, **cursor_filter(cursor)}
+
+        # Fetch one extra doc to learn whether another page exists
+        docs = (
+            await self.engine.get_collection(Review)
+            .find(query)
+            .sort(CURSOR_SORT)
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+
+        reviews = [Review.model_validate_doc(doc) for doc in docs[:limit]]
+        next_cursor = None
+        if len(docs) > limit:
+            last = reviews[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return reviews, next_cursor
+
     async def get_total_reviews(self, cleaner_id: str) -> int:
         """Count total reviews for a cleaner."""
         return await self.engine.count(Review, Review.cleaner_id == cleaner_id)
@@ -71,8 +112,9 @@ class ReviewCRUD:
         """
         Calculate cleaner stats: (average_rating, total_reviews).
 
-        Note: This executes a full scan aggregation. In production with millions
-        of reviews, we would cache this or update incrementally on write.
+        Note: This scans every review of the cleaner. Request paths read the
+        incrementally maintained stats on CleanerProfile instead
+        (see cleaner_crud.add_review_rating); use this for recounts.
         """
         # Get all reviews for calculation (for MVP scale)
         # TODO: Use MongoDB aggregation pipeline for better performance at scale
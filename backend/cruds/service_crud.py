@@ -5,15 +5,37 @@ Database operations for ServicePackage model using ODMantic.
 Handles all service package-related database queries and mutations.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime
-from bson import ObjectId
+from pymongo import ReturnDocument
+from motor.motor_asyncio import AsyncIOMotorCollection
 from odmantic import AIOEngine
 
 from models.service_model import ServicePackage, PriceType
-from models.cleaner_profile_model import ServiceCategory
+from models.cleaner_profile_model import to_service_category
+from commons.object_id import parse_object_id
 from database.database import get_engine
 
+# Pre-built enum lookup (exact value first, lowercased value as fallback)
+_PRICE_TYPE_MAP: Dict[str, PriceType] = {p.value: p for p in PriceType}
+
+
+def _to_price_type(value: str) -> PriceType:
+    """Resolve a price type string to its enum member (case-insensitive)."""
+    price_type = _PRICE_TYPE_MAP.get(value) or _PRICE_TYPE_MAP.get(value.lower())
+    if price_type is None:
+        raise ValueError(f"'{value}' is not a valid PriceType")
+    return price_type
+
+
+# Server-side sort specs for search_services (``_id`` keeps pages stable)
+_SORT_SPECS: Dict[str, Dict[str, int]] = {
+    "price_low": {"price": 1, "_id": 1},
+    "price_high": {"price": -1, "_id": 1},
+    "newest": {"created_at": -1, "_id": -1},
+    "duration": {"duration_hours": 1, "_id": 1},
+}
+
 
 class ServiceCRUD:
     """
@@ -39,12 +61,28 @@ class ServiceCRUD:
             engine: Optional ODMantic engine. If not provided, uses default.
         """
         self._engine = engine
+        self._coll: Optional[AsyncIOMotorCollection] = None
+        self._coll_engine: Optional[AIOEngine] = None
 
     @property
     def engine(self) -> AIOEngine:
         """Get the ODMantic engine."""
         return self._engine or get_engine()
 
+    @property
+    def coll(self) -> AsyncIOMotorCollection:
+        """
+        Get the raw Motor collection for ServicePackage.
+
+        Resolved once per engine and cached, so hot paths that talk to
+        Motor directly skip ODMantic's per-call collection lookup.
+        """
+        engine = self.engine
+        if self._coll is None or self._coll_engine is not engine:
+            self._coll = engine.get_collection(ServicePackage)
+            self._coll_engine = engine
+        return self._coll
+
     # =========================================================================
     # CREATE Operations
     # =========================================================================
@@ -86,12 +124,13 @@ class ServiceCRUD:
             )
 
         # Convert category string to enum
-        category = ServiceCategory(service_data.get("category", "regular").lower())
+        category = to_service_category(service_data.get("category", "regular"))
 
         # Convert price_type string to enum
-        price_type = PriceType(service_data.get("price_type", "flat").lower())
+        price_type = _to_price_type(service_data.get("price_type", "flat"))
 
         # Create service object
+        now = datetime.utcnow()
         service = ServicePackage(
             cleaner_id=cleaner_id,
             name=service_data["name"].strip(),
@@ -101,8 +140,8 @@ class ServiceCRUD:
             price_type=price_type,
             duration_hours=service_data.get("duration_hours", 1.0),
             is_active=True,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
         # Save to database
@@ -123,13 +162,12 @@ class ServiceCRUD:
         Returns:
             ServicePackage if found, None otherwise
         """
-        try:
-            return await self.engine.find_one(
-                ServicePackage, ServicePackage.id == ObjectId(service_id)
-            )
-        except Exception:
+        oid = parse_object_id(service_id)
+        if oid is None:
             return None
 
+        return await self.engine.find_one(ServicePackage, ServicePackage.id == oid)
+
     async def get_services_by_cleaner(
         self,
         cleaner_id: str,
@@ -153,6 +191,31 @@ class ServiceCRUD:
         services = await self.engine.find(ServicePackage, *filters)
         return list(services)
 
+    async def aiter_services_by_cleaner(
+        self,
+        cleaner_id: str,
+        active_only: bool = False,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ServicePackage]:
+        """
+        Stream a cleaner's service packages without materializing a list.
+
+        Args:
+            cleaner_id: Cleaner's User ID as string
+            active_only: If True, only yield active services
+            batch_size: Documents fetched per cursor round trip
+
+        Yields:
+            ServicePackage objects
+        """
+        query: Dict[str, Any] = {"cleaner_id": cleaner_id}
+        if active_only:
+            query["is_active"] = True
+
+        cursor = self.coll.find(query)
+        async for doc in cursor.batch_size(batch_size):
+            yield ServicePackage.model_validate_doc(doc)
+
     async def count_services_by_cleaner(self, cleaner_id: str) -> int:
         """
         Count total services for a cleaner.
@@ -163,9 +226,100 @@ class ServiceCRUD:
         Returns:
             Count of services
         """
-        return await self.engine.count(
-            ServicePackage, ServicePackage.cleaner_id == cleaner_id
+        return await self.coll.count_documents({"cleaner_id": cleaner_id})
+
+    def _build_search_filter(
+        self,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        price_type: Optional[str] = None,
+        active_only: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Build the raw MongoDB match filter shared by search and count.
+
+        Args:
+            Same filters as search_services()
+
+        Returns:
+            MongoDB query dictionary
+        """
+        match: Dict[str, Any] = {}
+
+        if category:
+            match["category"] = to_service_category(category).value
+
+        price_range: Dict[str, float] = {}
+        if min_price is not None:
+            price_range["$gte"] = min_price
+        if max_price is not None:
+            price_range["$lte"] = max_price
+        if price_range:
+            match["price"] = price_range
+
+        if price_type:
+            match["price_type"] = _to_price_type(price_type).value
+
+        if active_only:
+            match["is_active"] = True
+
+        return match
+
+    async def search_services_with_count(
+        self,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        price_type: Optional[str] = None,
+        active_only: bool = True,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "price_low",
+    ) -> Tuple[List[ServicePackage], int]:
+        """
+        Search service packages and count all matches in one round trip.
+
+        Runs a single ``$facet`` aggregation so the match filter is
+        evaluated once for both the requested page and the total.
+
+        Args:
+            Same as search_services()
+
+        Returns:
+            Tuple of (page of ServicePackage objects, total match count)
+        """
+        match = self._build_search_filter(
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            price_type=price_type,
+            active_only=active_only,
         )
+        sort_spec = _SORT_SPECS.get(sort_by, _SORT_SPECS["price_low"])
+
+        pipeline = [
+            {"$match": match},
+            {
+                "$facet": {
+                    "items": [
+                        {"$sort": sort_spec},
+                        {"$skip": skip},
+                        {"$limit": limit},
+                    ],
+                    "total": [{"$count": "n"}],
+                }
+            },
+        ]
+
+        result = await self.coll.aggregate(pipeline).to_list(length=1)
+        if not result:
+            return [], 0
+
+        facet = result[0]
+        items = [ServicePackage.model_validate_doc(doc) for doc in facet["items"]]
+        total = facet["total"][0]["n"] if facet["total"] else 0
+        return items, total
 
     async def search_services(
         self,
@@ -194,43 +348,17 @@ class ServiceCRUD:
         Returns:
             List of matching ServicePackage objects
         """
-        filters = []
-
-        if category:
-            filters.append(ServicePackage.category == ServiceCategory(category.lower()))
-
-        if min_price is not None:
-            filters.append(ServicePackage.price >= min_price)
-
-        if max_price is not None:
-            filters.append(ServicePackage.price <= max_price)
-
-        if price_type:
-            filters.append(ServicePackage.price_type == PriceType(price_type.lower()))
-
-        if active_only:
-            filters.append(ServicePackage.is_active == True)
-
-        # Execute query
-        if filters:
-            services = await self.engine.find(
-                ServicePackage, *filters, skip=skip, limit=limit
-            )
-        else:
-            services = await self.engine.find(ServicePackage, skip=skip, limit=limit)
-
-        # Sort results
-        result = list(services)
-        if sort_by == "price_low":
-            result.sort(key=lambda s: s.price)
-        elif sort_by == "price_high":
-            result.sort(key=lambda s: s.price, reverse=True)
-        elif sort_by == "newest":
-            result.sort(key=lambda s: s.created_at, reverse=True)
-        elif sort_by == "duration":
-            result.sort(key=lambda s: s.duration_hours)
-
-        return result
+        services, _ = await self.search_services_with_count(
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            price_type=price_type,
+            active_only=active_only,
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+        )
+        return services
 
     async def count_services(
         self,
@@ -249,27 +377,14 @@ class ServiceCRUD:
         Returns:
             Total count of matching services
         """
-        filters = []
-
-        if category:
-            filters.append(ServicePackage.category == ServiceCategory(category.lower()))
-
-        if min_price is not None:
-            filters.append(ServicePackage.price >= min_price)
-
-        if max_price is not None:
-            filters.append(ServicePackage.price <= max_price)
-
-        if price_type:
-            filters.append(ServicePackage.price_type == PriceType(price_type.lower()))
-
-        if active_only:
-            filters.append(ServicePackage.is_active == True)
-
-        if filters:
-            return await self.engine.count(ServicePackage, *filters)
-        else:
-            return await self.engine.count(ServicePackage)
+        match = self._build_search_filter(
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            price_type=price_type,
+            active_only=active_only,
+        )
+        return await self.engine.count(ServicePackage, match)
 
     # =========================================================================
     # UPDATE Operations
@@ -313,11 +428,11 @@ class ServiceCRUD:
 
         # Handle category separately (needs enum conversion)
         if "category" in update_data and update_data["category"] is not None:
-            service.category = ServiceCategory(update_data["category"].lower())
+            service.category = to_service_category(update_data["category"])
 
         # Handle price_type separately (needs enum conversion)
         if "price_type" in update_data and update_data["price_type"] is not None:
-            service.price_type = PriceType(update_data["price_type"].lower())
+            service.price_type = _to_price_type(update_data["price_type"])
 
         # Update timestamp
         service.update_timestamp()
@@ -339,15 +454,17 @@ class ServiceCRUD:
         Returns:
             Updated ServicePackage if found, None otherwise
         """
-        service = await self.get_service_by_id(service_id)
-        if not service:
+        oid = parse_object_id(service_id)
+        if oid is None:
             return None
 
-        service.is_active = is_active
-        service.update_timestamp()
-
-        await self.engine.save(service)
-        return service
+        # Single find-and-modify instead of fetch + save
+        doc = await self.coll.find_one_and_update(
+            {"_id": oid},
+            {"$set": {"is_active": is_active, "updated_at": datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return ServicePackage.model_validate_doc(doc) if doc else None
 
     # =========================================================================
     # DELETE Operations
@@ -363,12 +480,13 @@ class ServiceCRUD:
         Returns:
             True if deleted successfully, False if not found
         """
-        service = await self.get_service_by_id(service_id)
-        if not service:
+        oid = parse_object_id(service_id)
+        if oid is None:
             return False
 
-        await self.engine.delete(service)
-        return True
+        # Single targeted delete (no fetch of the doc being removed)
+        result = await self.coll.delete_one({"_id": oid})
+        return result.deleted_count == 1
 
     async def delete_all_services_by_cleaner(self, cleaner_id: str) -> int:
         """
@@ -380,9 +498,8 @@ class ServiceCRUD:
         Returns:
             Number of services deleted
         """
-        services = await self.get_services_by_cleaner(cleaner_id)
         count = 0
-        for service in services:
+        async for service in self.aiter_services_by_cleaner(cleaner_id):
             await self.engine.delete(service)
             count += 1
         return count
@@ -5,14 +5,23 @@ Database operations for User model using ODMantic.
 Handles all user-related database queries and mutations.
 """
 
-from typing import Optional, List
+import asyncio
+from typing import Optional, List, Dict
 from datetime import datetime
-from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
 from odmantic import AIOEngine
 
 from models.user_model import User, UserRole
 from commons.security import hash_password, verify_password
+from commons.object_id import parse_object_id
 from database.database import get_engine
+from database.indexes import EMAIL_COLLATION
+
+# Role string -> enum lookup (unknown roles fall back to cleaner, as before)
+_ROLE_MAP: Dict[str, UserRole] = {
+    "customer": UserRole.CUSTOMER,
+    "cleaner": UserRole.CLEANER,
+}
 
 
 class UserCRUD:
@@ -34,12 +43,28 @@ class UserCRUD:
             engine: Optional ODMantic engine. If not provided, uses default.
         """
         self._engine = engine
+        self._coll: Optional[AsyncIOMotorCollection] = None
+        self._coll_engine: Optional[AIOEngine] = None
 
     @property
     def engine(self) -> AIOEngine:
         """Get the ODMantic engine."""
         return self._engine or get_engine()
 
+    @property
+    def coll(self) -> AsyncIOMotorCollection:
+        """
+        Get the raw Motor collection for User.
+
+        Resolved once per engine and cached, so hot paths that talk to
+        Motor directly skip ODMantic's per-call collection lookup.
+        """
+        engine = self.engine
+        if self._coll is None or self._coll_engine is not engine:
+            self._coll = engine.get_collection(User)
+            self._coll_engine = engine
+        return self._coll
+
     # =========================================================================
     # CREATE Operations
     # =========================================================================
@@ -81,13 +106,14 @@ class UserCRUD:
         if existing_user:
             raise ValueError(f"User with email {email} already exists")
 
-        # Hash the password
-        password_hash = hash_password(password)
+        # Hash the password (bcrypt is slow; run it off the event loop)
+        password_hash = await asyncio.to_thread(hash_password, password)
 
         # Convert role string to enum
-        user_role = UserRole.CUSTOMER if role == "customer" else UserRole.CLEANER
+        user_role = _ROLE_MAP.get(role, UserRole.CLEANER)
 
         # Create user object
+        now = datetime.utcnow()
         user = User(
             email=email.lower().strip(),
             password_hash=password_hash,
@@ -96,8 +122,8 @@ class UserCRUD:
             phone=phone,
             is_active=True,
             email_verified=False,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
         # Save to database
@@ -142,9 +168,10 @@ class UserCRUD:
             raise ValueError(f"User with email {email} already exists")
 
         # Convert role string to enum
-        user_role = UserRole.CUSTOMER if role == "customer" else UserRole.CLEANER
+        user_role = _ROLE_MAP.get(role, UserRole.CLEANER)
 
         # Create user object (no password for OAuth users)
+        now = datetime.utcnow()
         user = User(
             email=email.lower().strip(),
             password_hash=None,  # No password for OAuth users
@@ -155,8 +182,8 @@ class UserCRUD:
             role=user_role,
             is_active=True,
             email_verified=True,  # Google already verified the email
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
         # Save to database
@@ -173,7 +200,11 @@ class UserCRUD:
         Returns:
             User object if found, None otherwise
         """
-        return await self.engine.find_one(User, User.google_id == google_id)
+        # auth_provider is part of the query so the partial google_id index
+        # (auth_provider == "google") can serve it
+        return await self.engine.find_one(
+            User, User.auth_provider == "google", User.google_id == google_id
+        )
 
     async def update_user_google_info(
         self,
@@ -222,12 +253,12 @@ class UserCRUD:
         Returns:
             User object if found, None otherwise
         """
-        try:
-            user = await self.engine.find_one(User, User.id == ObjectId(user_id))
-            return user
-        except Exception:
+        oid = parse_object_id(user_id)
+        if oid is None:
             return None
 
+        return await self.engine.find_one(User, User.id == oid)
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """
         Get a user by their email address.
@@ -238,7 +269,11 @@ class UserCRUD:
         Returns:
             User object if found, None otherwise
         """
-        return await self.engine.find_one(User, User.email == email.lower().strip())
+        # Case folding is done by the collation-backed index, not in Python
+        doc = await self.coll.find_one(
+            {"email": email.strip()}, collation=EMAIL_COLLATION
+        )
+        return User.model_validate_doc(doc) if doc else None
 
     async def get_all_users(
         self,
@@ -263,7 +298,7 @@ class UserCRUD:
         filters = []
 
         if role:
-            user_role = UserRole.CUSTOMER if role == "customer" else UserRole.CLEANER
+            user_role = _ROLE_MAP.get(role, UserRole.CLEANER)
             filters.append(User.role == user_role)
 
         if is_active is not None:
@@ -295,7 +330,7 @@ class UserCRUD:
         filters = []
 
         if role:
-            user_role = UserRole.CUSTOMER if role == "customer" else UserRole.CLEANER
+            user_role = _ROLE_MAP.get(role, UserRole.CLEANER)
             filters.append(User.role == user_role)
 
         if is_active is not None:
@@ -373,7 +408,7 @@ class UserCRUD:
         if not user:
             return False
 
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await asyncio.to_thread(hash_password, new_password)
         user.updated_at = datetime.utcnow()
 
         await self.engine.save(user)
@@ -398,7 +433,7 @@ class UserCRUD:
         if not user:
             return False
 
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await asyncio.to_thread(hash_password, new_password)
         user.updated_at = datetime.utcnow()
 
         await self.engine.save(user)
@@ -414,15 +449,36 @@ class UserCRUD:
         Returns:
             True if updated successfully, False if user not found
         """
-        user = await self.get_user_by_email(email)
-        if not user:
-            return False
+        # Single atomic $set; matched (not modified) so re-verifying is a no-op
+        result = await self.coll.update_one(
+            {"email": email.strip()},
+            {"$set": {"email_verified": True, "updated_at": datetime.utcnow()}},
+            collation=EMAIL_COLLATION,
+        )
+        return result.matched_count > 0
 
-        user.email_verified = True
-        user.updated_at = datetime.utcnow()
+    async def verify_user_emails(self, emails: List[str]) -> List[str]:
+        """
+        Mark several users' emails as verified in one update.
 
-        await self.engine.save(user)
-        return True
+        Args:
+            emails: Email addresses to verify
+
+        Returns:
+            The stored emails of the users that were found (and verified)
+        """
+        query = {"email": {"$in": [email.strip() for email in emails]}}
+        found = await self.coll.find(
+            query, {"email": 1}, collation=EMAIL_COLLATION
+        ).to_list(length=None)
+        if not found:
+            return []
+
+        await self.coll.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in found]}},
+            {"$set": {"email_verified": True, "updated_at": datetime.utcnow()}},
+        )
+        return [doc["email"] for doc in found]
 
     async def deactivate_user(self, user_id: str) -> bool:
         """
@@ -481,12 +537,13 @@ class UserCRUD:
         Note:
             Consider using deactivate_user() for soft delete instead.
         """
-        user = await self.get_user_by_id(user_id)
-        if not user:
+        oid = parse_object_id(user_id)
+        if oid is None:
             return False
 
-        await self.engine.delete(user)
-        return True
+        # Single targeted delete (no fetch of the doc being removed)
+        result = await self.coll.delete_one({"_id": oid})
+        return result.deleted_count == 1
 
     # =========================================================================
     # Authentication Helpers
@@ -528,7 +585,10 @@ class UserCRUD:
         if user.auth_provider != "local":
             return None
 
-        if not verify_password(password, user.password_hash):
+        password_ok = await asyncio.to_thread(
+            verify_password, password, user.password_hash
+        )
+        if not password_ok:
             return None
 
         if not user.is_active:
@@ -555,7 +615,9 @@ class UserCRUD:
         if not user:
             return False
 
-        return verify_password(current_password, user.password_hash)
+        return await asyncio.to_thread(
+            verify_password, current_password, user.password_hash
+        )
 
 
 # Create a singleton instance for easy import
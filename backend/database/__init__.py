@@ -6,6 +6,7 @@ from database.database import (
     db_instance,
     connect_to_mongo,
     close_mongo_connection,
+    mongo_session,
     get_engine,
 )
 
@@ -14,5 +15,6 @@ __all__ = [
     "db_instance",
     "connect_to_mongo",
     "close_mongo_connection",
+    "mongo_session",
     "get_engine",
 ]
@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 from motor.motor_asyncio import AsyncIOMotorClient
 from odmantic import AIOEngine
 from dotenv import load_dotenv
@@ -8,6 +9,15 @@ load_dotenv()
 
 logging = logger(__name__)
 
+# Connection pool sizing (override via environment)
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "5"))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000"))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2500"))
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(
+    os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "3000")
+)
+
 
 class Database:
     # Step 1: Hold MongoDB client
@@ -25,7 +35,12 @@ async def connect_to_mongo():
     # Step 4: Create MongoDB client (lazy connection)
     try:
         db_instance.client = AsyncIOMotorClient(
-            os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+            os.getenv("MONGODB_URI", "mongodb://localhost:27017"),
+            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+            minPoolSize=MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGODB_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
         )
 
         # Step 5: Create ODMantic engine using the client
@@ -50,6 +65,16 @@ async def close_mongo_connection():
         logging.info("Closed MongoDB connection")
 
 
+@asynccontextmanager
+async def mongo_session():
+    # Connect for the duration of a block (scripts); always closes the client
+    await connect_to_mongo()
+    try:
+        yield db_instance
+    finally:
+        await close_mongo_connection()
+
+
 def get_engine() -> AIOEngine:
     # Step 8: Provide ODMantic engine for CRUD operations
     return db_instance.engine
@@ -0,0 +1,207 @@
+"""
+Database Indexes
+================
+MongoDB indexes for every collection, including the geospatial, collated
+and partial ones that ODMantic does not create on its own.
+
+Built on application startup (see core/apis/api.py lifespan) and by
+scripts/create_indexes.py. createIndexes is a no-op for indexes that
+already exist, so this is safe to run on every start.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List
+
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, IndexModel
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from database.database import db_instance
+from commons.pagination import CURSOR_SORT
+from commons.logger import logger
+
+log = logger(__name__)
+
+# Case-insensitive email matching for the users.email index; queries must
+# pass the same collation to use it (see cruds/user_crud.py)
+EMAIL_COLLATION: Dict[str, Any] = {"locale": "en", "strength": 2}
+
+
+def build_index_plan() -> Dict[str, List[IndexModel]]:
+    """Index definitions, keyed by collection name."""
+    # =========================================================================
+    # User Indexes
+    # =========================================================================
+
+    user_indexes = [
+        # 1. Unique, case-insensitive email index
+        # Lookups pass the same collation so they can use this index
+        IndexModel("email", unique=True, collation=EMAIL_COLLATION),
+        # 2. Google OAuth login lookup
+        # Partial: only Google-auth users get an index entry, local users
+        # (google_id = null) cost nothing and don't collide on uniqueness
+        IndexModel(
+            [("google_id", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"auth_provider": "google"},
+        ),
+    ]
+
+    # =========================================================================
+    # Cleaner Profile Indexes
+    # =========================================================================
+
+    cleaner_profile_indexes = [
+        # 1. Geospatial Index for location search
+        # This is critical for $geoNear queries
+        IndexModel([("loc", GEOSPHERE)]),
+        # 2. Compound index for common search filters
+        # city + specializations is a very common query
+        IndexModel([("city", ASCENDING), ("specializations", ASCENDING)]),
+        # 3. Index for availability
+        IndexModel([("is_available", ASCENDING)]),
+    ]
+
+    # =========================================================================
+    # Service Package Indexes
+    # =========================================================================
+
+    service_indexes = [
+        # 1. Index for price sorting
+        IndexModel([("price", ASCENDING)]),
+        # 2. Compound indexes matching search_services filter + sort
+        # Equality fields first, sort key last, so Mongo can return results
+        # in index order instead of sorting in memory.
+        # (cleaner_id, is_active, category) replaces the cleaner_id,
+        # is_active and category singletons.
+        IndexModel(
+            [
+                ("is_active", ASCENDING),
+                ("category", ASCENDING),
+                ("price", ASCENDING),
+            ]
+        ),
+        IndexModel(
+            [
+                ("is_active", ASCENDING),
+                ("category", ASCENDING),
+                ("created_at", DESCENDING),
+            ]
+        ),
+        IndexModel(
+            [
+                ("is_active", ASCENDING),
+                ("price_type", ASCENDING),
+                ("price", ASCENDING),
+            ]
+        ),
+        IndexModel(
+            [
+                ("cleaner_id", ASCENDING),
+                ("is_active", ASCENDING),
+                ("category", ASCENDING),
+            ]
+        ),
+    ]
+
+    # =========================================================================
+    # Booking Indexes
+    # =========================================================================
+
+    # Equality -> Sort -> Range, matching the real booking query shapes
+    booking_indexes = [
+        # 1. "My bookings" for a customer, newest first
+        IndexModel([("customer_id", ASCENDING), ("scheduled_date", DESCENDING)]),
+        # 2. Cleaner's jobs by status, newest first (also availability checks)
+        IndexModel(
+            [
+                ("cleaner_id", ASCENDING),
+                ("status", ASCENDING),
+                ("scheduled_date", DESCENDING),
+            ]
+        ),
+        # 3. Bookings in a given status over a date range
+        IndexModel([("status", ASCENDING), ("scheduled_date", ASCENDING)]),
+        # 4. Cursor pagination seek key
+        IndexModel(CURSOR_SORT),
+        # 5. Availability overlap check (range on the epoch start)
+        IndexModel(
+            [
+                ("cleaner_id", ASCENDING),
+                ("status", ASCENDING),
+                ("scheduled_at_epoch", ASCENDING),
+            ]
+        ),
+    ]
+
+    # =========================================================================
+    # Review Indexes
+    # =========================================================================
+
+    review_indexes = [
+        # 1. Cursor pagination of a cleaner's reviews
+        IndexModel([("cleaner_id", ASCENDING), *CURSOR_SORT]),
+        # 2. Cursor pagination seek key
+        IndexModel(CURSOR_SORT),
+        # 3. One review per booking (enforced by the DB, not a pre-read)
+        IndexModel([("booking_id", ASCENDING)], unique=True),
+    ]
+
+    # =========================================================================
+    # Payment Indexes
+    # =========================================================================
+
+    payment_indexes = [
+        # 1. Cursor pagination seek key
+        IndexModel(CURSOR_SORT),
+        # 2. Unique gateway transaction ID
+        # Partial: payments without a transaction_id (null) are not indexed
+        IndexModel(
+            [("transaction_id", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"transaction_id": {"$type": "string"}},
+        ),
+    ]
+
+    # =========================================================================
+    # Payment Gateway Log Indexes
+    # =========================================================================
+
+    gateway_log_indexes = [
+        # 1. One log document per payment (transaction_id may be null)
+        IndexModel([("payment_id", ASCENDING)], unique=True),
+    ]
+
+    return {
+        "users": user_indexes,
+        "cleaner_profiles": cleaner_profile_indexes,
+        "services": service_indexes,
+        "bookings": booking_indexes,
+        "reviews": review_indexes,
+        "payments": payment_indexes,
+        "payment_gateway_logs": gateway_log_indexes,
+    }
+
+
+async def create_indexes(db: AsyncIOMotorDatabase):
+    """Create all indexes: one createIndexes command per collection, in parallel."""
+    index_plan = build_index_plan()
+    for name, indexes in index_plan.items():
+        log.info(f"Creating {len(indexes)} index(es) on {name}...")
+
+    await asyncio.gather(
+        *(db[name].create_indexes(indexes) for name, indexes in index_plan.items())
+    )
+
+
+async def ensure_indexes():
+    """
+    Build indexes on the connected database (application startup).
+
+    Uniqueness rules such as one review per booking rely on these indexes,
+    so a failure is raised and aborts startup instead of being skipped.
+    """
+    await create_indexes(
+        db_instance.client[os.getenv("DATABASE_NAME", "authentication")]
+    )
+    log.info("Database indexes ensured")
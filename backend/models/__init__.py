@@ -2,7 +2,7 @@
 # This package contains all ODMantic document models for MongoDB
 
 from models.user_model import User, UserRole
-from models.cleaner_profile_model import CleanerProfile, ServiceCategory, Location
+from models.cleaner_profile_model import CleanerProfile, ServiceCategory
 from models.service_model import ServicePackage, PriceType
 
 __all__ = [
@@ -10,7 +10,6 @@ __all__ = [
     "UserRole",
     "CleanerProfile",
     "ServiceCategory",
-    "Location",
     "ServicePackage",
     "PriceType",
 ]
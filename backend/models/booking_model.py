@@ -11,12 +11,71 @@ Collection: bookings
 """
 
 from odmantic import Model, Field, EmbeddedModel
+from pydantic import field_validator, model_validator
 from datetime import datetime
-from typing import Optional
-from enum import Enum
+from functools import lru_cache
+import re
+from typing import List, Optional, Union
+from enum import Enum, IntEnum
 
+# Bound once at import; used for timestamp defaults
+_utcnow = datetime.utcnow
 
-class BookingStatus(str, Enum):
+# 24-hour "HH:MM" (single-digit hour allowed, as in CreateBookingRequest)
+_HHMM_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]\d)")
+
+
+@lru_cache(maxsize=1440)
+def _parse_hhmm(value: str) -> int:
+    """
+    Parse an "HH:MM" time string into minutes since midnight.
+
+    Cached: there are only 1440 distinct valid times in a day.
+
+    Raises:
+        ValueError: If the string is not a valid 24-hour time
+    """
+    match = _HHMM_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid time '{value}', expected HH:MM")
+    return int(match[1]) * 60 + int(match[2])
+
+
+def compute_end_time(start_time: str, duration_hours: float) -> str:
+    """
+    Calculate the "HH:MM" end time of a booking (wraps past midnight).
+
+    Args:
+        start_time: Start time in "HH:MM" format
+        duration_hours: Booking length in hours
+
+    Returns:
+        End time in "HH:MM" format
+    """
+    total = _parse_hhmm(start_time) + int(duration_hours * 60)
+    return "%02d:%02d" % divmod(total % 1440, 60)
+
+
+# Naive UTC epoch (scheduled_date is stored as naive UTC midnight)
+_EPOCH = datetime(1970, 1, 1)
+
+
+def schedule_epoch(scheduled_date: datetime, start_time: str) -> int:
+    """
+    Combine a booking date and "HH:MM" start time into epoch seconds (UTC).
+
+    Args:
+        scheduled_date: Booking date (time-of-day part is ignored)
+        start_time: Start time in "HH:MM" format
+
+    Returns:
+        Seconds since the Unix epoch
+    """
+    days = (scheduled_date.date() - _EPOCH.date()).days
+    return days * 86400 + _parse_hhmm(start_time) * 60
+
+
+class BookingStatus(IntEnum):
     """
     Status of a booking in its lifecycle.
 
@@ -26,14 +85,44 @@ class BookingStatus(str, Enum):
     - COMPLETED: Job finished successfully
     - CANCELLED: Cancelled by customer or cleaner
     - REJECTED: Rejected by cleaner
+
+    Stored as a small int (compact status index, integer comparisons).
+    The API still speaks lowercase names: use `label` for output, and
+    BookingStatus("pending") resolves names for input and legacy docs.
     """
 
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-    REJECTED = "rejected"
+    PENDING = 0
+    CONFIRMED = 1
+    IN_PROGRESS = 2
+    COMPLETED = 3
+    CANCELLED = 4
+    REJECTED = 5
+
+    @classmethod
+    def _missing_(cls, value):
+        """Accept the lowercase API name (e.g. "in_progress")."""
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in API requests and responses."""
+        return self.name.lower()
+
+    @property
+    def stored_values(self) -> List[Union[int, str]]:
+        """
+        Values this status may be stored as, for $in filters: the int code,
+        or the legacy name on documents not yet converted by migrate_data.
+        """
+        return [self.value, self.label]
+
+
+# Statuses that still hold the cleaner's time slot
+ACTIVE_STATUSES = frozenset(
+    {BookingStatus.PENDING, BookingStatus.CONFIRMED, BookingStatus.IN_PROGRESS}
+)
 
 
 class PaymentStatus(str, Enum):
@@ -75,6 +164,8 @@ class Booking(Model):
         scheduled_date: Date of service (YYYY-MM-DD)
         start_time: Start time (HH:MM)
         duration_hours: Expected duration
+        scheduled_at_epoch: Start as epoch seconds, derived from the two
+            fields above (used for range/overlap queries)
 
         total_price: Final price (Service Price + Platform Fee)
         platform_fee: Fee retained by platform
@@ -87,16 +178,19 @@ class Booking(Model):
     # ==========================================================================
     # References
     # ==========================================================================
-    customer_id: str = Field(index=True)
-    cleaner_id: str = Field(index=True)
+    # customer_id / cleaner_id / scheduled_date / status are covered by the
+    # compound indexes in scripts/create_indexes.py
+    customer_id: str
+    cleaner_id: str
     service_id: str = Field(index=True)
 
     # ==========================================================================
     # Schedule
     # ==========================================================================
-    scheduled_date: datetime = Field(index=True)  # Store as datetime for querying
+    scheduled_date: datetime  # Store as datetime for querying
     start_time: str  # Format: "HH:MM"
     duration_hours: float
+    scheduled_at_epoch: Optional[int] = None  # Derived; see fill_schedule_epoch
 
     # ==========================================================================
     # Financials (Snapshot at time of booking)
@@ -109,7 +203,7 @@ class Booking(Model):
     # ==========================================================================
     # Details
     # ==========================================================================
-    status: BookingStatus = Field(default=BookingStatus.PENDING, index=True)
+    status: BookingStatus = Field(default=BookingStatus.PENDING)
     address: BookingAddress
     special_instructions: Optional[str] = None
 
@@ -120,24 +214,41 @@ class Booking(Model):
     # ==========================================================================
     # Timestamps
     # ==========================================================================
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     model_config = {"collection": "bookings"}
 
     def update_timestamp(self):
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _utcnow()
+
+    @field_validator("start_time")
+    @classmethod
+    def validate_start_time(cls, v: str) -> str:
+        """Ensure start_time is a valid "HH:MM" string."""
+        _parse_hhmm(v)
+        return v
+
+    @model_validator(mode="after")
+    def fill_schedule_epoch(self) -> "Booking":
+        """Derive scheduled_at_epoch from scheduled_date + start_time if unset."""
+        if self.scheduled_at_epoch is None:
+            # Plain object.__setattr__: ODMantic's change tracking is not
+            # initialized yet while validators run
+            object.__setattr__(
+                self,
+                "scheduled_at_epoch",
+                schedule_epoch(self.scheduled_date, self.start_time),
+            )
+        return self
+
+    @property
+    def start_minutes(self) -> int:
+        """Start time as minutes since midnight."""
+        return _parse_hhmm(self.start_time)
 
     @property
     def end_time(self) -> str:
         """Helper to calculate end time based on start_time and duration."""
-        # Simple implementation, can be expanded
-        try:
-            h, m = map(int, self.start_time.split(":"))
-            total_minutes = h * 60 + m + int(self.duration_hours * 60)
-            end_h = (total_minutes // 60) % 24
-            end_m = total_minutes % 60
-            return f"{end_h:02d}:{end_m:02d}"
-        except:
-            return ""
+        return compute_end_time(self.start_time, self.duration_hours)
@@ -11,11 +11,20 @@ Technology: ODMantic (MongoDB ODM for FastAPI)
 Collection: cleaner_profiles
 """
 
-from odmantic import Model, EmbeddedModel, Field
+from odmantic import Model, Field
+from pydantic import field_validator
 from datetime import datetime
 from typing import Optional, List, Dict
 from enum import Enum
 
+# Bound once at import; used for timestamp defaults
+_utcnow = datetime.utcnow
+
+
+def rating_to_x100(rating: float) -> int:
+    """Convert a 0.0 - 5.0 star rating to hundredths, rounding half up."""
+    return int(rating * 100 + 0.5)
+
 
 class ServiceCategory(str, Enum):
     """
@@ -35,18 +44,16 @@ class ServiceCategory(str, Enum):
     SPECIALIZED = "specialized"
 
 
-class Location(EmbeddedModel):
-    """
-    Embedded model for GeoJSON Point location.
+# Pre-built lookup (exact value first, lowercased value as fallback)
+_CATEGORY_MAP: Dict[str, ServiceCategory] = {c.value: c for c in ServiceCategory}
 
-    MongoDB uses GeoJSON format for geospatial queries.
-    Format: { "type": "Point", "coordinates": [longitude, latitude] }
 
-    Note: MongoDB expects [longitude, latitude] order (not lat, lng).
-    """
-
-    type: str = Field(default="Point")
-    coordinates: List[float] = Field(default_factory=lambda: [0.0, 0.0])
+def to_service_category(value: str) -> ServiceCategory:
+    """Resolve a category string to its enum member (case-insensitive)."""
+    category = _CATEGORY_MAP.get(value) or _CATEGORY_MAP.get(value.lower())
+    if category is None:
+        raise ValueError(f"'{value}' is not a valid ServiceCategory")
+    return category
 
 
 class CleanerProfile(Model):
@@ -68,11 +75,14 @@ class CleanerProfile(Model):
         city: City name for search/filtering (indexed)
         state: State/province name
         pincode: Postal/ZIP code
-        location: GeoJSON Point for location-based "nearby" search
+        loc: [longitude, latitude] pair for location-based "nearby" search
+            (legacy coordinate pair; the GeoJSON form is the location property)
         service_radius_km: Maximum travel distance from base location
 
         is_available: Whether currently accepting new bookings
-        avg_rating: Computed average star rating (0.0 - 5.0)
+        avg_rating_x100: Average star rating in hundredths (0 - 500);
+            read it as a float through the avg_rating property
+        rating_sum: Sum of all review ratings (avg = rating_sum / total_reviews)
         total_reviews: Total number of reviews received
         completed_jobs: Number of successfully completed bookings
         verified: Whether profile has been admin-verified
@@ -102,7 +112,7 @@ class CleanerProfile(Model):
     city: str = Field(default="", index=True)
     state: Optional[str] = None
     pincode: Optional[str] = None
-    location: Optional[Dict] = None  # GeoJSON Point for geo queries
+    loc: Optional[List[float]] = None  # [lng, lat], 2dsphere-indexed
     service_radius_km: float = Field(default=10.0, ge=1.0, le=100.0)
 
     # ==========================================================================
@@ -114,33 +124,47 @@ class CleanerProfile(Model):
     # ==========================================================================
     # Performance Stats (updated by other phases)
     # ==========================================================================
-    avg_rating: float = Field(default=0.0, ge=0.0, le=5.0)
+    avg_rating_x100: int = Field(default=0, ge=0, le=500)
+    rating_sum: int = Field(default=0, ge=0)
     total_reviews: int = Field(default=0, ge=0)
     completed_jobs: int = Field(default=0, ge=0)
 
     # ==========================================================================
     # Timestamps
     # ==========================================================================
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     model_config = {"collection": "cleaner_profiles"}
 
     def update_timestamp(self):
         """Update the updated_at timestamp to current time."""
-        self.updated_at = datetime.utcnow()
-
-    def update_rating(self, new_avg: float, total: int):
-        """
-        Update rating stats after a new review is submitted.
-
-        Args:
-            new_avg: Newly calculated average rating
-            total: New total review count
-        """
-        self.avg_rating = round(new_avg, 2)
-        self.total_reviews = total
-        self.update_timestamp()
+        self.updated_at = _utcnow()
+
+    @field_validator("loc")
+    @classmethod
+    def validate_loc(cls, v: Optional[List[float]]) -> Optional[List[float]]:
+        """Ensure loc is a [longitude, latitude] pair (2dsphere / $geoNear)."""
+        if v is None:
+            return v
+        if len(v) != 2:
+            raise ValueError("loc must be a [longitude, latitude] pair")
+        lng, lat = v
+        if not (-180.0 <= lng <= 180.0 and -90.0 <= lat <= 90.0):
+            raise ValueError("loc coordinates out of range")
+        return v
+
+    @property
+    def location(self) -> Optional[Dict]:
+        """Location as a GeoJSON Point (API output format)."""
+        if not self.loc:
+            return None
+        return {"type": "Point", "coordinates": list(self.loc)}
+
+    @property
+    def avg_rating(self) -> float:
+        """Average star rating (0.0 - 5.0)."""
+        return self.avg_rating_x100 / 100
 
     def increment_completed_jobs(self):
         """Increment the completed jobs counter after a booking is fulfilled."""
@@ -0,0 +1,42 @@
+"""
+Gateway Log Model
+=================
+Raw payment gateway responses, stored apart from the Payment document.
+
+Payment reads (status checks, booking lookups) never need the raw gateway
+payload, so it lives in its own collection keyed by payment_id and is
+only fetched on demand. This keeps Payment documents small and fixed-size.
+
+Technology: ODMantic (MongoDB ODM)
+Collection: payment_gateway_logs
+"""
+
+from odmantic import Model, Field
+from datetime import datetime
+from typing import Optional
+
+# Bound once at import; used for timestamp defaults
+_utcnow = datetime.utcnow
+
+
+class GatewayLog(Model):
+    """
+    Latest raw gateway response for a payment.
+
+    Attributes:
+        payment_id: ID of the Payment this response belongs to (unique)
+        transaction_id: External gateway transaction ID, if one was issued
+        response: Raw response payload from the payment gateway
+
+        created_at: When the first response was logged
+        updated_at: When the response was last replaced
+    """
+
+    payment_id: str  # unique index: see database/indexes.py
+    transaction_id: Optional[str] = None
+    response: dict
+
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    model_config = {"collection": "payment_gateway_logs"}
@@ -18,6 +18,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+# Bound once at import; used for timestamp defaults
+_utcnow = datetime.utcnow
+
 
 class PaymentStatus(str, Enum):
     """Status of a payment transaction."""
@@ -53,7 +56,7 @@ class Payment(Model):
         method: Payment method used
 
         transaction_id: External gateway transaction ID (e.g., Stripe/Razorpay ID)
-        gateway_response: Raw response from payment gateway (optional, for logs)
+            (raw gateway responses are kept in GatewayLog, keyed by payment id)
 
         created_at: When the payment was initiated
         updated_at: Last status update time
@@ -68,10 +71,10 @@ class Payment(Model):
     status: PaymentStatus = Field(default=PaymentStatus.PENDING, index=True)
     method: PaymentMethod = Field(default=PaymentMethod.CARD)
 
+    # Unique when set: partial unique index in scripts/create_indexes.py
     transaction_id: Optional[str] = Field(None, index=True)
-    gateway_response: Optional[dict] = None
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     model_config = {"collection": "payments"}
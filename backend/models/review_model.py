@@ -17,13 +17,16 @@ from odmantic import Model, Field
 from datetime import datetime
 from typing import Optional
 
+# Bound once at import; used for timestamp defaults
+_utcnow = datetime.utcnow
+
 
 class Review(Model):
     """
     Review document model.
 
     Attributes:
-        booking_id: ID of the completed booking
+        booking_id: ID of the completed booking (unique: one review per booking)
         customer_id: User ID of the reviewer
         cleaner_id: User ID of the reviewed cleaner
 
@@ -33,13 +36,13 @@ class Review(Model):
         created_at: Submission timestamp
     """
 
-    booking_id: str = Field(index=True)
+    booking_id: str = Field(unique=True, index=True)
     customer_id: str = Field(index=True)
     cleaner_id: str = Field(index=True)
 
     rating: int = Field(ge=1, le=5)
     comment: Optional[str] = None
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
     model_config = {"collection": "reviews"}
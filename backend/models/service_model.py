@@ -18,6 +18,9 @@ from enum import Enum
 
 from models.cleaner_profile_model import ServiceCategory
 
+# Bound once at import; used for timestamp defaults
+_utcnow = datetime.utcnow
+
 
 class PriceType(str, Enum):
     """
@@ -59,14 +62,14 @@ class ServicePackage(Model):
     # ==========================================================================
     # Cleaner Reference (Many-to-One)
     # ==========================================================================
-    cleaner_id: str = Field(index=True)
+    cleaner_id: str
 
     # ==========================================================================
     # Service Details
     # ==========================================================================
     name: str = Field(min_length=3, max_length=100)
     description: Optional[str] = None
-    category: ServiceCategory = Field(default=ServiceCategory.REGULAR, index=True)
+    category: ServiceCategory = Field(default=ServiceCategory.REGULAR)
 
     # ==========================================================================
     # Pricing
@@ -78,19 +81,19 @@ class ServicePackage(Model):
     # ==========================================================================
     # Status
     # ==========================================================================
-    is_active: bool = Field(default=True, index=True)
+    is_active: bool = Field(default=True)
 
     # ==========================================================================
     # Timestamps
     # ==========================================================================
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     model_config = {"collection": "services"}
 
     def update_timestamp(self):
         """Update the updated_at timestamp to current time."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _utcnow()
 
     def __repr__(self) -> str:
         return (
@@ -13,6 +13,9 @@ from datetime import datetime
 from typing import Optional
 from enum import Enum
 
+# Bound once at import; used for timestamp defaults
+_utcnow = datetime.utcnow
+
 
 class UserRole(str, Enum):
     """
@@ -50,6 +53,9 @@ class User(Model):
     password_hash: Optional[str] = None  # Optional for OAuth users
 
     # OAuth Fields
+    # google_id is indexed by a partial unique index covering only
+    # auth_provider == "google" (scripts/create_indexes.py), so auth_provider
+    # must be set to "google" whenever google_id is.
     auth_provider: str = Field(default="local")  # "local" or "google"
     google_id: Optional[str] = None  # Google's unique user ID
 
@@ -64,14 +70,14 @@ class User(Model):
     email_verified: bool = Field(default=False)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     model_config = {"collection": "users"}
 
     def update_timestamp(self):
         """Update the updated_at timestamp to current time."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _utcnow()
 
     def __repr__(self) -> str:
         return f"User(email={self.email}, role={self.role.value})"
@@ -0,0 +1,234 @@
+"""
+Migrate Existing Data
+=====================
+One-off, idempotent back-fills for fields and formats introduced after
+documents were first written. Safe to re-run: each step only touches
+documents that still need it.
+
+Usage:
+    python -m scripts.migrate_data
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+from pymongo.errors import OperationFailure
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.database import mongo_session
+from models.booking_model import BookingStatus
+from commons.logger import logger
+
+log = logger(__name__)
+
+
+async def backfill_booking_schedule_epoch(db) -> int:
+    """
+    Set bookings.scheduled_at_epoch from scheduled_date + start_time.
+
+    Runs server-side as a single update pipeline:
+    epoch seconds of the date + hours * 3600 + minutes * 60.
+    """
+    time_parts = {"$split": ["$start_time", ":"]}
+    date_ms = {"$toLong": "$scheduled_date"}
+    # Whole days since the epoch, in seconds (drops any time-of-day part)
+    day_seconds = {"$multiply": [{"$floor": {"$divide": [date_ms, 86400000]}}, 86400]}
+    result = await db["bookings"].update_many(
+        {"scheduled_at_epoch": {"$exists": False}},
+        [
+            {
+                "$set": {
+                    "scheduled_at_epoch": {
+                        "$toLong": {
+                            "$add": [
+                                day_seconds,
+                                {
+                                    "$multiply": [
+                                        {"$toInt": {"$arrayElemAt": [time_parts, 0]}},
+                                        3600,
+                                    ]
+                                },
+                                {
+                                    "$multiply": [
+                                        {"$toInt": {"$arrayElemAt": [time_parts, 1]}},
+                                        60,
+                                    ]
+                                },
+                            ]
+                        }
+                    }
+                }
+            }
+        ],
+    )
+    return result.modified_count
+
+
+async def convert_booking_status_to_int(db) -> int:
+    """Rewrite legacy string booking statuses ("pending", ...) as ints."""
+    updated = 0
+    for member in BookingStatus:
+        result = await db["bookings"].update_many(
+            {"status": member.label}, {"$set": {"status": member.value}}
+        )
+        updated += result.modified_count
+    return updated
+
+
+async def move_payment_gateway_responses(db) -> int:
+    """Move inline payments.gateway_response blobs to payment_gateway_logs."""
+    moved = 0
+    cursor = db["payments"].find(
+        {"gateway_response": {"$exists": True}},
+        {"transaction_id": 1, "gateway_response": 1, "updated_at": 1},
+    )
+    async for doc in cursor:
+        if doc.get("gateway_response"):
+            now = doc.get("updated_at") or datetime.utcnow()
+            await db["payment_gateway_logs"].update_one(
+                {"payment_id": str(doc["_id"])},
+                {
+                    "$setOnInsert": {
+                        "transaction_id": doc.get("transaction_id"),
+                        "response": doc["gateway_response"],
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                },
+                upsert=True,
+            )
+            moved += 1
+
+    await db["payments"].update_many(
+        {"gateway_response": {"$exists": True}}, {"$unset": {"gateway_response": ""}}
+    )
+    return moved
+
+
+async def convert_cleaner_rating_to_x100(db) -> int:
+    """Replace cleaner_profiles.avg_rating (float) with avg_rating_x100 (int)."""
+    result = await db["cleaner_profiles"].update_many(
+        {"avg_rating": {"$exists": True}},
+        [
+            {
+                "$set": {
+                    "avg_rating_x100": {
+                        "$toInt": {"$round": [{"$multiply": ["$avg_rating", 100]}, 0]}
+                    }
+                }
+            },
+            {"$unset": "avg_rating"},
+        ],
+    )
+    return result.modified_count
+
+
+async def recompute_cleaner_rating_stats(db) -> int:
+    """
+    Recompute cleaner_profiles.rating_sum / total_reviews / avg_rating_x100
+    from the reviews collection.
+
+    Runs for every profile, not only those missing rating_sum: a profile
+    reviewed after deploy but before this ran was seeded from that single
+    review and needs correcting too. The recompute is idempotent.
+    """
+    updated = 0
+    reviewed = []
+    pipeline = [
+        {
+            "$group": {
+                "_id": "$cleaner_id",
+                "rating_sum": {"$sum": "$rating"},
+                "total_reviews": {"$sum": 1},
+            }
+        }
+    ]
+    async for stats in db["reviews"].aggregate(pipeline):
+        total = stats["total_reviews"]
+        reviewed.append(stats["_id"])
+        result = await db["cleaner_profiles"].update_one(
+            {"user_id": stats["_id"]},
+            {
+                "$set": {
+                    "rating_sum": stats["rating_sum"],
+                    "total_reviews": total,
+                    "avg_rating_x100": int(stats["rating_sum"] * 100 / total + 0.5),
+                }
+            },
+        )
+        updated += result.modified_count
+
+    # Cleaners without any reviews
+    result = await db["cleaner_profiles"].update_many(
+        {"user_id": {"$nin": reviewed}},
+        {"$set": {"rating_sum": 0, "total_reviews": 0, "avg_rating_x100": 0}},
+    )
+    return updated + result.modified_count
+
+
+async def convert_cleaner_location_to_pair(db) -> int:
+    """Replace GeoJSON cleaner_profiles.location with a [lng, lat] loc pair."""
+    result = await db["cleaner_profiles"].update_many(
+        {"location": {"$exists": True}},
+        [{"$set": {"loc": "$location.coordinates"}}, {"$unset": "location"}],
+    )
+
+    # The 2dsphere index now lives on loc (see create_indexes)
+    try:
+        await db["cleaner_profiles"].drop_index("location_2dsphere")
+    except OperationFailure:
+        pass
+    return result.modified_count
+
+
+async def migrate_data():
+    """Run all data migrations in order."""
+    log.info("Connecting to database...")
+    async with mongo_session() as conn:
+        db = conn.client[os.getenv("DATABASE_NAME", "authentication")]
+
+        # =====================================================================
+        # Booking Migrations
+        # =====================================================================
+
+        log.info("Back-filling bookings.scheduled_at_epoch...")
+        count = await backfill_booking_schedule_epoch(db)
+        log.info(f"Updated {count} booking(s)")
+
+        log.info("Converting bookings.status to integer codes...")
+        count = await convert_booking_status_to_int(db)
+        log.info(f"Updated {count} booking(s)")
+
+        # =====================================================================
+        # Cleaner Profile Migrations
+        # =====================================================================
+
+        log.info("Converting cleaner_profiles.avg_rating to avg_rating_x100...")
+        count = await convert_cleaner_rating_to_x100(db)
+        log.info(f"Updated {count} profile(s)")
+
+        log.info("Converting cleaner_profiles.location to loc pairs...")
+        count = await convert_cleaner_location_to_pair(db)
+        log.info(f"Updated {count} profile(s)")
+
+        log.info("Recomputing cleaner_profiles rating stats from reviews...")
+        count = await recompute_cleaner_rating_stats(db)
+        log.info(f"Updated {count} profile(s)")
+
+        # =====================================================================
+        # Payment Migrations
+        # =====================================================================
+
+        log.info("Moving payments.gateway_response to payment_gateway_logs...")
+        count = await move_payment_gateway_responses(db)
+        log.info(f"Moved {count} gateway response(s)")
+
+    log.info("All migrations completed successfully!")
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_data())
@@ -1,10 +1,14 @@
 """
 Verify User Script
 ==================
-Manually verify a user's email for testing purposes.
+Manually verify users' emails for testing purposes.
 
 Usage:
-    python -m scripts.verify_user <email>
+    python -m scripts.verify_user <email> [<email> ...]
+
+In-process use (e.g. from a test harness, with the DB already connected):
+    from scripts.verify_user import verify_user
+    await verify_user("user@example.com")
 """
 
 import sys
@@ -14,30 +18,44 @@ import asyncio
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.database import connect_to_mongo, close_mongo_connection
+from database.database import mongo_session
 from cruds.user_crud import user_crud
 
 
-async def verify_user(email: str):
-    """Mark user as verified."""
-    await connect_to_mongo()
+async def verify_user(email: str) -> bool:
+    """
+    Mark a single user as verified, without spawning this script.
 
-    print(f"Verifying user: {email}")
-    success = await user_crud.verify_user_email(email)
+    Expects an open database connection (connect_to_mongo() or mongo_session()).
+
+    Returns:
+        True if the user was found and verified, False otherwise
+    """
+    return await user_crud.verify_user_email(email)
 
-    if success:
-        print(f"Successfully verified {email}")
-    else:
-        print(f"User not found: {email}")
-        sys.exit(1)
 
-    await close_mongo_connection()
+async def verify_users(emails: list):
+    """Mark users as verified (single update for all emails)."""
+    async with mongo_session():
+        print(f"Verifying {len(emails)} user(s)")
+        verified = await user_crud.verify_user_emails(emails)
+    verified = {email.lower() for email in verified}
+
+    missing = False
+    for email in emails:
+        if email.strip().lower() in verified:
+            print(f"Successfully verified {email}")
+        else:
+            print(f"User not found: {email}")
+            missing = True
+
+    if missing:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python -m scripts.verify_user <email>")
+        print("Usage: python -m scripts.verify_user <email> [<email> ...]")
         sys.exit(1)
 
-    email = sys.argv[1]
-    asyncio.run(verify_user(email))
+    asyncio.run(verify_users(sys.argv[1:]))
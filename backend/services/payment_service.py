@@ -7,9 +7,12 @@ In a real world scenario, this would use the gateway's SDK or API.
 For MVP, we generate fake transaction IDs and simulate success/failure.
 """
 
-import uuid
+import os
 import random
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
+
+# Random bytes per transaction ID (12 hex chars)
+_TXN_ID_BYTES = 6
 
 
 class PaymentService:
@@ -26,8 +29,8 @@ class PaymentService:
         Returns:
             Dict containing 'transaction_id' and 'gateway_url' (mock).
         """
-        # Generate a fake transaction ID (like 'pay_L8S9dcc83jD')
-        txn_id = f"pay_{uuid.uuid4().hex[:12]}"
+        # Generate a fake transaction ID (like 'pay_4f1c9a0be27d')
+        txn_id = f"pay_{os.urandom(_TXN_ID_BYTES).hex()}"
 
         # In a real app, this would call Stripe.PaymentIntent.create()
         return {
@@ -55,7 +58,15 @@ class PaymentService:
 
     def generate_receipt_id(self) -> str:
         """Generate a receipt number."""
-        return f"RCPT-{uuid.uuid4().hex[:8].upper()}"
+        return f"RCPT-{os.urandom(4).hex().upper()}"
+
+    def batch_txn_ids(self, n: int) -> List[str]:
+        """Generate n transaction IDs from a single random read."""
+        raw = os.urandom(_TXN_ID_BYTES * n)
+        return [
+            f"pay_{raw[i : i + _TXN_ID_BYTES].hex()}"
+            for i in range(0, len(raw), _TXN_ID_BYTES)
+        ]
 
 
 payment_service = PaymentService()
@@ -0,0 +1,75 @@
+"""
+Booking availability check against partially migrated booking documents.
+
+Runs on an in-memory Mongo (mongomock-motor); skipped if it is not installed.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from odmantic import AIOEngine
+
+from cruds.booking_crud import BookingCRUD
+from models.booking_model import Booking, schedule_epoch
+
+DAY = datetime(2026, 11, 2)
+
+
+def _check(docs, date, start_time, duration_hours):
+    """Insert raw booking docs and run the availability check for cleaner c1."""
+
+    async def run():
+        engine = AIOEngine(client=mongomock_motor.AsyncMongoMockClient(), database="t")
+        await engine.get_collection(Booking).insert_many(docs)
+        crud = BookingCRUD(engine=engine)
+        return await crud.check_cleaner_availability(
+            "c1", date, start_time, duration_hours
+        )
+
+    return asyncio.run(run())
+
+
+def _booking(status, start_time="10:00", duration_hours=2.0, epoch=True):
+    doc = {
+        "cleaner_id": "c1",
+        "status": status,
+        "scheduled_date": DAY,
+        "start_time": start_time,
+        "duration_hours": duration_hours,
+    }
+    if epoch:
+        doc["scheduled_at_epoch"] = schedule_epoch(DAY, start_time)
+    return doc
+
+
+def test_epoch_with_int_status_blocks_overlap():
+    assert _check([_booking(1)], DAY, "11:00", 1.0) is False
+
+
+def test_epoch_with_legacy_string_status_blocks_overlap():
+    # Epoch back-filled, status not yet converted to its int code
+    assert _check([_booking("confirmed")], DAY, "11:00", 1.0) is False
+
+
+def test_missing_epoch_with_legacy_string_status_blocks_overlap():
+    assert _check([_booking("pending", epoch=False)], DAY, "11:00", 1.0) is False
+
+
+def test_missing_epoch_across_midnight_blocks_overlap():
+    late = _booking("pending", start_time="22:00", duration_hours=4.0, epoch=False)
+    next_day = datetime(2026, 11, 3)
+    assert _check([late], next_day, "01:00", 1.0) is False
+    assert _check([late], next_day, "02:00", 1.0) is True
+
+
+def test_terminal_statuses_do_not_block():
+    docs = [_booking("cancelled"), _booking(4, epoch=False)]
+    assert _check(docs, DAY, "11:00", 1.0) is True
+
+
+def test_adjacent_booking_is_available():
+    assert _check([_booking("confirmed")], DAY, "12:00", 1.0) is True